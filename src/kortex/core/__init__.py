@@ -1,6 +1,5 @@
 # Core modules for Kortex
 from kortex.core.ollama_service import OllamaService
-from kortex.core.chat_controller import ChatController
 
 # Database module
 from kortex.core.database import (
@@ -10,18 +9,12 @@ from kortex.core.database import (
     Message,
 )
 
-# Tools module
+# Tools module (base types only; concrete tools resolve lazily below)
 from kortex.core.tools import (
     Permission,
     ToolResult,
     ToolCall,
     BaseTool,
-    ReadDirectoryTool,
-    ReadFileTool,
-    WriteFileTool,
-    RunCommandTool,
-    ToolRegistry,
-    tool_registry,
 )
 
 # Agent module
@@ -30,11 +23,31 @@ from kortex.core.agent import (
     AgentState,
     get_agent_service,
     check_required_models,
-    ROUTER_MODEL,
     TOOL_MODEL,
     REQUIRED_AGENT_MODELS,
 )
 
+def __getattr__(name: str):
+    # ChatController drags in PySide6 (~100ms cold import); resolve it
+    # lazily so headless imports of kortex.core stay cheap
+    if name == "ChatController":
+        from kortex.core.chat_controller import ChatController
+        return ChatController
+    # Concrete tools and the registry pull in their whole modules (and
+    # the registry instantiates every tool), so they resolve on demand
+    if name in (
+        "ReadDirectoryTool",
+        "ReadFileTool",
+        "WriteFileTool",
+        "RunCommandTool",
+        "ToolRegistry",
+        "tool_registry",
+    ):
+        from kortex.core import tools
+        return getattr(tools, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # Services
     "OllamaService",
@@ -60,7 +73,6 @@ __all__ = [
     "AgentState",
     "get_agent_service",
     "check_required_models",
-    "ROUTER_MODEL",
     "TOOL_MODEL",
     "REQUIRED_AGENT_MODELS",
 ]
@@ -3,12 +3,9 @@ from kortex.core.agent.state import AgentState
 from kortex.core.agent.service import AgentService, get_agent_service
 from kortex.core.agent.utils import check_required_models
 from kortex.core.agent.constants import (
-    ROUTER_MODEL,
     TOOL_MODEL,
     REQUIRED_AGENT_MODELS,
-    ROUTER_PROMPT,
-    TOOL_PROMPT,
-    SUMMARY_PROMPT,
+    SYSTEM_PROMPT,
 )
 from kortex.core.agent.models import (
     ReadDirArgs,
@@ -26,12 +23,9 @@ __all__ = [
     # Utils
     "check_required_models",
     # Constants
-    "ROUTER_MODEL",
     "TOOL_MODEL",
     "REQUIRED_AGENT_MODELS",
-    "ROUTER_PROMPT",
-    "TOOL_PROMPT",
-    "SUMMARY_PROMPT",
+    "SYSTEM_PROMPT",
     # Models
     "ReadDirArgs",
     "ReadFileArgs",
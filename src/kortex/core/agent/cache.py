@@ -0,0 +1,131 @@
+"""Two-tier response cache for the agent service."""
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """Two-tier (in-memory LRU + SQLite) cache for LLM responses.
+
+    Lookups hit the in-memory tier first and fall back to the SQLite
+    table, promoting hits back into memory. Writes go through to both,
+    so repeated prompts survive process restarts. If the database cannot
+    be opened the cache degrades to memory-only.
+    """
+
+    #: Default lifetime of a cached response. Model behaviour drifts as
+    #: prompts, tools and models evolve, so stale entries expire rather
+    #: than pinning an old answer forever.
+    DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        db_path: Optional[Path] = None,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._memory: OrderedDict[bytes, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.db_path: Optional[Path] = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            # Path setup lives inside the try: an unwritable ~/.cache
+            # must degrade to memory-only, not break agent startup
+            if self.db_path is None:
+                cache_dir = Path.home() / ".cache" / "kortex"
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                self.db_path = cache_dir / "llm_cache.db"
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS cache (
+                    key BLOB PRIMARY KEY,
+                    response_text TEXT NOT NULL,
+                    created_at INTEGER NOT NULL
+                )
+                """
+            )
+            # Evict entries past their TTL once at startup instead of
+            # checking timestamps on the hot read path
+            self._conn.execute(
+                "DELETE FROM cache WHERE created_at < ?",
+                (int(time.time()) - self._ttl_seconds,),
+            )
+            self._conn.commit()
+        except Exception as e:
+            logger.warning(f"Persistent LLM cache unavailable: {e}")
+            self._conn = None
+
+    def get(self, key: bytes) -> Optional[str]:
+        """Look up a cached response, promoting SQLite hits to memory."""
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                self._memory.move_to_end(key)
+                return cached
+
+            if self._conn is None:
+                return None
+
+            try:
+                row = self._conn.execute(
+                    "SELECT response_text FROM cache WHERE key = ? AND created_at >= ?",
+                    (key, int(time.time()) - self._ttl_seconds),
+                ).fetchone()
+            except Exception as e:
+                logger.debug(f"Persistent cache read failed: {e}")
+                return None
+
+            if row is None:
+                return None
+
+            self._store_in_memory(key, row[0])
+            return row[0]
+
+    def put(self, key: bytes, response_text: str) -> None:
+        """Write a response through to both tiers."""
+        with self._lock:
+            self._store_in_memory(key, response_text)
+
+            if self._conn is None:
+                return
+
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, response_text, created_at) VALUES (?, ?, ?)",
+                    (key, response_text, int(time.time())),
+                )
+                self._conn.commit()
+            except Exception as e:
+                logger.debug(f"Persistent cache write failed: {e}")
+
+    def clear(self) -> None:
+        """Drop all cached responses from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute("DELETE FROM cache")
+                self._conn.commit()
+            except Exception as e:
+                logger.debug(f"Persistent cache clear failed: {e}")
+
+    def _store_in_memory(self, key: bytes, response_text: str) -> None:
+        """Insert into the LRU tier, evicting past the cap. Lock held."""
+        self._memory[key] = response_text
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
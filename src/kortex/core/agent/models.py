@@ -9,6 +9,7 @@ class ReadDirArgs(BaseModel):
     """Arguments for read_dir tool."""
     path: str = Field(description="The absolute or relative path to the directory to list")
     show_hidden: bool = Field(default=False, description="Whether to include hidden files")
+    max_entries: int = Field(default=1000, description="Maximum number of entries to list")
 
 
 class ReadFileArgs(BaseModel):
@@ -1,15 +1,23 @@
 """Agent service for agentic AI capabilities with tool calling.
 
-This module implements a router-based agent system that uses:
-- gemma3:270m as a router model to decide if tools are needed
-- functiongemma:270m for actual tool calling
-- The user's selected model for non-tool responses and summarization
+This module implements a single-call agent: every user message goes to the
+tool-capable model (functiongemma:270m) with tools bound. If the model
+returns tool calls they are executed and one continuation call is made;
+otherwise its content is used directly as the chat response.
 """
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import hashlib
+import json
 import logging
-import uuid
-from typing import Optional
+import os
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import ClassVar, Generator, Optional
 
 from langchain_ollama import ChatOllama
 from langchain_core.messages import (
@@ -18,9 +26,8 @@ from langchain_core.messages import (
     SystemMessage,
     ToolMessage,
 )
-from langchain_core.tools import StructuredTool
-
 from kortex.core.tools import ToolCall, tool_registry
+from kortex.core.agent.cache import ResponseCache
 from kortex.core.agent.state import AgentState
 from kortex.core.agent.models import (
     ReadDirArgs,
@@ -29,29 +36,167 @@ from kortex.core.agent.models import (
     RunCmdArgs,
 )
 from kortex.core.agent.constants import (
-    ROUTER_MODEL,
     TOOL_MODEL,
-    ROUTER_PROMPT,
-    TOOL_PROMPT,
-    SUMMARY_PROMPT,
+    SYSTEM_PROMPT,
 )
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of cached LLM responses kept per service instance
+RESPONSE_CACHE_MAX_ENTRIES = 512
+
+# Normalize cache keys so trivial variations (case, extra whitespace)
+# still hit; set KORTEX_CACHE_NORMALIZE=0 for strict exact matching
+_CACHE_NORMALIZE = os.environ.get("KORTEX_CACHE_NORMALIZE", "1") != "0"
+
+
+def _norm(s: str) -> str:
+    """Collapse whitespace and case for cache-key purposes only."""
+    return " ".join(s.strip().lower().split())
+
+
+# orjson serializes severalfold faster than the stdlib; fall back
+# silently when it is not installed
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, sort_keys=True).encode()
+
+
+# Thread pool for running I/O-bound tool calls concurrently; wall time for
+# a multi-tool turn becomes the max of the latencies instead of the sum
+_tool_executor = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("KORTEX_TOOL_CONCURRENCY", "4")),
+    thread_name_prefix="kortex-tool",
+)
+
+# Dispatch table for converting history dicts to LangChain messages;
+# roles without an entry (e.g. tool-internal ones) are skipped
+_ROLE_TO_MSG = {
+    "user": HumanMessage,
+    "assistant": AIMessage,
+}
+
+# Per-resource locks so side-effecting tools never race on the same target
+_resource_locks: defaultdict[str, threading.Lock] = defaultdict(threading.Lock)
+_resource_locks_guard = threading.Lock()
+
+
+def _resource_lock_key(tool_call: ToolCall) -> Optional[str]:
+    """Key identifying the resource a side-effecting tool call touches.
+
+    Returns None for read-only tools, which can run fully in parallel.
+    """
+    if tool_call.tool_name == "run_cmd":
+        return "shell"
+    if tool_call.tool_name == "write_file":
+        path = str(tool_call.arguments.get("path", ""))
+        return os.path.abspath(os.path.expanduser(path))
+    return None
+
+
+# Map tool names to their Pydantic arg schemas; static for the process
+# lifetime, so defined once at module scope
+_ARG_SCHEMAS = {
+    "read_dir": ReadDirArgs,
+    "read_file": ReadFileArgs,
+    "write_file": WriteFileArgs,
+    "run_cmd": RunCmdArgs,
+}
+
+
+def _build_tool_specs() -> list[dict]:
+    """Pre-serialize tool specs in OpenAI function format.
+
+    bind_tools accepts these dicts directly, so pydantic schema
+    generation happens exactly once at import instead of on every bind.
+    """
+    specs = []
+
+    for base_tool in tool_registry.get_all():
+        schema_model = _ARG_SCHEMAS.get(base_tool.name)
+        if schema_model is not None:
+            specs.append({
+                "type": "function",
+                "function": {
+                    "name": base_tool.name,
+                    "description": base_tool.description,
+                    "parameters": schema_model.model_json_schema(),
+                },
+            })
+
+    return specs
+
+
+# The registry's tool set is fixed, so build the tool specs once at
+# import instead of on every AgentService (re)initialization
+_TOOL_SPECS = _build_tool_specs()
+
+
+@lru_cache(maxsize=8)
+def _get_bound_llm(model: str, host: str) -> ChatOllama:
+    """Return a shared, tools-bound ChatOllama for (model, host).
+
+    Each ChatOllama carries its own httpx connection pool, so reusing
+    instances avoids reconnect churn and repeated tool binding when
+    services are (re)created against the same endpoint.
+    """
+    llm = ChatOllama(model=model, base_url=host)
+    if _TOOL_SPECS:
+        llm = llm.bind_tools(_TOOL_SPECS)
+    return llm
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class _ToolInvocation:
+    """One executed (or denied) tool call and its outcome.
+
+    Slotted and frozen: cheaper than the dicts it replaces, attribute
+    access instead of string-keyed lookups, and immutable so result
+    aliasing for deduplicated calls can share instances safely.
+    """
+    call_id: str
+    tool_name: str
+    arguments: dict
+    result: dict
+
+
+def _execute_tool_call_locked(tool_call: ToolCall):
+    """Execute a tool call, serializing on its target resource if needed."""
+    key = _resource_lock_key(tool_call)
+    if key is None:
+        return tool_registry.execute_tool(tool_call.tool_name, tool_call.arguments)
+
+    with _resource_locks_guard:
+        lock = _resource_locks[key]
+    with lock:
+        return tool_registry.execute_tool(tool_call.tool_name, tool_call.arguments)
+
 
 class AgentService:
     """Service for running an AI agent with tool capabilities.
-    
-    This service implements a router-based approach:
-    1. Uses gemma3:270m as a router to determine if tools are needed
-    2. Routes to functiongemma:270m for tool calls
-    3. Uses the user's selected model for non-tool responses and summarization
+
+    A single call against the tool-capable model with bound tools handles
+    both chat and tool use: no tool_calls in the response means the content
+    is the final answer, so pure-chat messages cost one LLM roundtrip and
+    tool-use messages cost two.
     """
-    
-    # Prompts from constants
-    ROUTER_PROMPT = ROUTER_PROMPT
-    TOOL_PROMPT = TOOL_PROMPT
-    SUMMARY_PROMPT = SUMMARY_PROMPT
+
+    # Prompt from constants
+    SYSTEM_PROMPT = SYSTEM_PROMPT
+
+    # Rough token budget for conversation history sent to the model.
+    # Prefill cost grows linearly with prompt length, so unbounded
+    # histories make every turn of a long chat slower than the last.
+    MAX_HISTORY_TOKENS = 4096
+
+    # Shared message object for the constant system prompt; never mutated,
+    # so one instance serves every turn instead of a fresh pydantic model
+    _SYSTEM_MSG: ClassVar[SystemMessage] = SystemMessage(content=SYSTEM_PROMPT)
 
     def __init__(
         self,
@@ -60,298 +205,420 @@ class AgentService:
     ) -> None:
         self.model_name = model_name  # User's selected model
         self.host = host
-        self._router_llm: Optional[ChatOllama] = None
-        self._tool_llm: Optional[ChatOllama] = None
-        self._chat_llm: Optional[ChatOllama] = None
-        self._langchain_tools: list[StructuredTool] = []
-        self._init_llms()
-    
-    def _init_llms(self) -> None:
-        """Initialize the LangChain LLMs for routing, tools, and chat."""
+        self._llm: Optional[ChatOllama] = None
+        self._tool_specs: list[dict] = []
+        # Exact-match cache of chat-only responses (tool responses are
+        # side-effecting and never cached); persists across restarts
+        self._response_cache = ResponseCache(RESPONSE_CACHE_MAX_ENTRIES)
+        self._init_llm()
+
+    def _init_llm(self) -> None:
+        """Initialize the LangChain LLM with tools bound."""
         try:
-            # Create LangChain tools from our tool registry
-            self._langchain_tools = self._create_langchain_tools()
-            
-            # Router LLM (gemma3:270m) - for deciding if tools are needed
-            self._router_llm = ChatOllama(
-                model=ROUTER_MODEL,
-                base_url=self.host,
-            )
-            
-            # Tool LLM (functiongemma:270m) - for actual tool calling
-            self._tool_llm = ChatOllama(
-                model=TOOL_MODEL,
-                base_url=self.host,
-            )
-            
-            # Bind tools to the tool LLM
-            if self._langchain_tools:
-                self._tool_llm = self._tool_llm.bind_tools(self._langchain_tools)
-            
-            # Chat LLM (user's selected model) - for non-tool responses and summarization
-            self._chat_llm = ChatOllama(
-                model=self.model_name,
-                base_url=self.host,
-            )
-            
-            logger.info(f"Initialized agent with router={ROUTER_MODEL}, tools={TOOL_MODEL}, chat={self.model_name}")
-            
+            # Use the tool specs pre-serialized at module import
+            self._tool_specs = _TOOL_SPECS
+
+            # Single tool-capable LLM (functiongemma:270m), shared per
+            # (model, host) so its connection pool and tool binding are
+            # reused across service instances
+            self._llm = _get_bound_llm(TOOL_MODEL, self.host)
+
+            # Warm up off the critical path so the first real message does
+            # not pay for model load and tool-schema validation
+            threading.Thread(target=self._warm_up, daemon=True).start()
+
+            logger.info(f"Initialized agent with model={TOOL_MODEL}")
+
         except Exception as e:
-            logger.error(f"Failed to initialize agent LLMs: {e}")
-            self._router_llm = None
-            self._tool_llm = None
-            self._chat_llm = None
-    
-    def _create_langchain_tools(self) -> list[StructuredTool]:
-        """Create LangChain StructuredTool objects from our tools."""
-        tools = []
-        
-        # Map tool names to their Pydantic arg schemas
-        arg_schemas = {
-            "read_dir": ReadDirArgs,
-            "read_file": ReadFileArgs,
-            "write_file": WriteFileArgs,
-            "run_cmd": RunCmdArgs,
-        }
-        
-        for base_tool in tool_registry.get_all():
-            if base_tool.name in arg_schemas:
-                # Create a wrapper function that we won't actually use
-                # (we handle tool execution separately)
-                def dummy_func(**kwargs):
-                    return "Tool execution handled externally"
-                
-                tool = StructuredTool(
-                    name=base_tool.name,
-                    description=base_tool.description,
-                    args_schema=arg_schemas[base_tool.name],
-                    func=dummy_func,
-                )
-                tools.append(tool)
-        
-        return tools
-    
+            logger.error(f"Failed to initialize agent LLM: {e}")
+            self._llm = None
+
+    def _warm_up(self) -> None:
+        """Issue a tiny no-op invoke to pre-load the model and schemas."""
+        try:
+            self._llm.invoke([
+                SystemMessage(content="warmup"),
+                HumanMessage(content="hi"),
+            ])
+            logger.debug("Agent LLM warm-up complete")
+        except Exception as e:
+            logger.debug(f"Agent LLM warm-up failed: {e}")
+
     def update_model(self, model_name: str) -> None:
-        """Update the user's selected model (for chat and summarization)."""
+        """Record the user's selected model.
+
+        The agent pipeline always runs on the tool-capable model, so only
+        the stored name changes here.
+        """
         if model_name != self.model_name:
             self.model_name = model_name
-            # Only reinitialize the chat LLM, not the router or tool LLMs
-            try:
-                self._chat_llm = ChatOllama(
-                    model=self.model_name,
-                    base_url=self.host,
-                )
-                logger.info(f"Updated chat model to {self.model_name}")
-            except Exception as e:
-                logger.error(f"Failed to update chat model: {e}")
-    
+            logger.info(f"Updated selected model to {self.model_name}")
+
     def create_state(self) -> AgentState:
         """Create a new agent state."""
         return AgentState()
-    
-    def _route_message(self, user_message: str, history: list[dict] = None) -> bool:
-        """Use the router model to determine if tools are needed.
-        
-        Returns:
-            True if tools are needed, False for regular chat
+
+    def clear_cache(self) -> None:
+        """Drop all cached LLM responses."""
+        self._response_cache.clear()
+
+    def _cache_key(self, user_message: str, history: list[dict] = None) -> bytes:
+        """Build an exact-match cache key for a chat turn.
+
+        The key is normalized (the prompt sent to the model is not), so
+        inputs differing only in case or whitespace share an entry.
         """
-        if not self._router_llm:
-            logger.warning("Router LLM not available, defaulting to chat")
-            return False
-        
-        try:
-            messages = [
-                SystemMessage(content=self.ROUTER_PROMPT),
-                HumanMessage(content=user_message),
-            ]
-            
-            response = self._router_llm.invoke(messages)
-            decision = response.content.strip().upper() if hasattr(response, 'content') else ""
-            
-            logger.info(f"Router decision for '{user_message[:50]}...': {decision}")
-            
-            return "TOOLS" in decision
-            
-        except Exception as e:
-            logger.error(f"Router error: {e}, defaulting to chat")
-            return False
-    
-    def _chat_response(
-        self,
-        user_message: str,
-        history: list[dict] = None,
-    ) -> str:
-        """Get a regular chat response using the user's selected model."""
-        if not self._chat_llm:
-            return "Error: Chat model not initialized."
-        
-        try:
-            messages = []
-            
-            # Add conversation history
-            if history:
-                for msg in history:
-                    if msg["role"] == "user":
-                        messages.append(HumanMessage(content=msg["content"]))
-                    elif msg["role"] == "assistant":
-                        messages.append(AIMessage(content=msg["content"]))
-            
-            # Add the new user message
-            messages.append(HumanMessage(content=user_message))
-            
-            response = self._chat_llm.invoke(messages)
-            return response.content if hasattr(response, 'content') else str(response)
-            
-        except Exception as e:
-            logger.error(f"Chat response error: {e}")
-            return f"Error: {str(e)}"
-    
-    def _summarize_tool_results(
+        if _CACHE_NORMALIZE:
+            user_message = _norm(user_message)
+        prompt_digest = hashlib.md5(self.SYSTEM_PROMPT.encode()).hexdigest()
+        raw = b"|".join((
+            TOOL_MODEL.encode(),
+            prompt_digest.encode(),
+            _dumps(history or []),
+            user_message.encode(),
+        ))
+        return hashlib.blake2b(raw).digest()
+
+    def _cache_get(self, key: bytes) -> Optional[str]:
+        """Look up a cached response across both cache tiers."""
+        return self._response_cache.get(key)
+
+    def _cache_put(self, key: bytes, response_text: str) -> None:
+        """Write a response through to both cache tiers."""
+        self._response_cache.put(key, response_text)
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """Cheap token estimate (~4 chars/token for English text)."""
+        return len(text) // 4
+
+    def _truncate_history(self, history: list[dict]) -> list[dict]:
+        """Drop the oldest user/assistant pairs until under the budget.
+
+        A sliding window keeps the most recent context, which is what the
+        model actually needs; the estimate is rough but errs cheap - an
+        exact tokenizer pass would cost more than the tokens it saves.
+        """
+        total = sum(self._estimate_tokens(m["content"]) for m in history)
+        start = 0
+        while total > self.MAX_HISTORY_TOKENS and start < len(history) - 2:
+            # Drop a user+assistant pair together so the window never
+            # starts mid-exchange
+            total -= self._estimate_tokens(history[start]["content"])
+            total -= self._estimate_tokens(history[start + 1]["content"])
+            start += 2
+        if start:
+            logger.info(f"Truncated history: dropped {start} oldest messages")
+        return history[start:]
+
+    def _prepare_turn_messages(
         self,
         user_message: str,
-        tool_context: list[dict],
+        state: AgentState,
         history: list[dict] = None,
-    ) -> str:
-        """Summarize tool execution results using the user's selected model."""
-        if not self._chat_llm:
-            return "Error: Chat model not initialized."
-        
-        try:
-            # Build context about what tools were executed
-            tool_summary = "Tool execution results:\n"
-            for ctx in tool_context:
-                tool_name = ctx.get("tool_name", "unknown")
-                args = ctx.get("arguments", {})
-                result = ctx.get("result", {})
-                success = result.get("success", False)
-                output = result.get("output", "")
-                error = result.get("error", "")
-                
-                tool_summary += f"\n- {tool_name}({args}):\n"
-                if success:
-                    tool_summary += f"  Success: {output[:500]}...\n" if len(output) > 500 else f"  Success: {output}\n"
-                else:
-                    tool_summary += f"  Failed: {error}\n"
-            
-            messages = [
-                SystemMessage(content=self.SUMMARY_PROMPT),
-            ]
-            
-            # Add relevant history
-            if history:
-                for msg in history[-4:]:  # Last few messages for context
-                    if msg["role"] == "user":
-                        messages.append(HumanMessage(content=msg["content"]))
-                    elif msg["role"] == "assistant":
-                        messages.append(AIMessage(content=msg["content"]))
-            
-            # Add the context
-            messages.append(HumanMessage(
-                content=f"User request: {user_message}\n\n{tool_summary}\n\nPlease provide a helpful response based on these results."
-            ))
-            
-            response = self._chat_llm.invoke(messages)
-            return response.content if hasattr(response, 'content') else str(response)
-            
-        except Exception as e:
-            logger.error(f"Summarization error: {e}")
-            return f"Tools executed but summarization failed: {str(e)}"
-    
+    ) -> list:
+        """Build or extend the message list for a new turn.
+
+        Reusing the accumulated state.messages keeps the serialized
+        prompt prefix byte-identical across turns, so Ollama can reuse
+        its KV cache instead of re-prefilling the whole history.
+        """
+        if state.messages:
+            state.messages.append(HumanMessage(content=user_message))
+            return state.messages
+
+        messages = [self._SYSTEM_MSG]
+        messages.extend(
+            _ROLE_TO_MSG[m["role"]](content=m["content"])
+            for m in self._truncate_history(history or [])
+            if m["role"] in _ROLE_TO_MSG
+        )
+        messages.append(HumanMessage(content=user_message))
+        state.messages = messages
+        return messages
+
     def process_message(
         self,
         user_message: str,
         state: AgentState,
         history: list[dict] = None,
-    ) -> tuple[str, list[ToolCall], AgentState]:
+    ) -> Generator[str, None, tuple[str, list[ToolCall], AgentState]]:
         """
-        Process a user message using the router-based approach.
-        
-        1. Router (gemma3:270m) decides if tools are needed
-        2. If tools needed: functiongemma handles tool calls
-        3. If no tools: user's selected model handles the response
-        
+        Process a user message with a single bound-tools LLM call.
+
+        If the model returns tool calls, they are surfaced for execution;
+        otherwise its content is the final chat response.
+
+        Yields content chunks as they stream in from the model.
+
         Returns:
             tuple of (response_text, pending_tool_calls, updated_state)
         """
-        if not self._router_llm or not self._tool_llm or not self._chat_llm:
+        if not self._llm:
             return "Error: Agent not initialized. Please check if Ollama is running and required models are available.", [], state
-        
+
         try:
-            # Step 1: Route the message
-            needs_tools = self._route_message(user_message, history)
-            
-            if not needs_tools:
-                # Step 2a: Use chat model for regular response
-                logger.info("Router decided: CHAT - using selected model")
-                response = self._chat_response(user_message, history)
-                state.current_response = response
-                return response, [], state
-            
-            # Step 2b: Use tool model for tool calling
-            logger.info("Router decided: TOOLS - using functiongemma")
-            return self._process_tool_message(user_message, state, history)
-            
+            # Check the response cache before hitting the LLM
+            cache_key = self._cache_key(user_message, history)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.info("Response cache hit, skipping LLM call")
+                state.current_response = cached
+                # Keep the canonical message list in step so later turns
+                # still present a stable prefix to the server
+                if state.messages:
+                    state.messages.append(HumanMessage(content=user_message))
+                    state.messages.append(AIMessage(content=cached))
+                yield cached
+                return cached, [], state
+
+            messages = self._prepare_turn_messages(user_message, state, history)
+
+            # Stream the response, aggregating chunks so tool_calls are
+            # available once the stream completes
+            response = None
+            for chunk in self._llm.stream(messages):
+                response = chunk if response is None else response + chunk
+                content = chunk.content
+                if content:
+                    yield content
+
+            if response is None:
+                return "", [], state
+
+            # Check for tool calls
+            pending_calls = self._extract_tool_calls(response, state)
+
+            state.last_ai_message = response
+            state.in_tool_chain = bool(pending_calls)
+            state.pending_tool_calls = pending_calls
+            state.is_waiting_for_permission = any(tc.requires_permission for tc in pending_calls)
+
+            # Get text response (might be empty if only tool calls)
+            response_text = response.content or ""
+            state.current_response = response_text
+
+            if not pending_calls:
+                # Finished turn: append the reply so the next turn extends
+                # the same token prefix instead of rebuilding it
+                messages.append(response)
+                # Only cache pure-chat turns; tool responses are
+                # side-effecting
+                if response_text:
+                    self._cache_put(cache_key, response_text)
+
+            return response_text, pending_calls, state
+
         except Exception as e:
             logger.error(f"Error processing message: {e}")
             return f"Error: {str(e)}", [], state
-    
-    def _process_tool_message(
+
+    def process_messages_batch(
         self,
-        user_message: str,
-        state: AgentState,
-        history: list[dict] = None,
-    ) -> tuple[str, list[ToolCall], AgentState]:
-        """Process a message that requires tools using functiongemma."""
-        try:
-            # Build messages list for tool model
-            messages = [SystemMessage(content=self.TOOL_PROMPT)]
-            
-            # Add conversation history
-            if history:
-                for msg in history:
-                    if msg["role"] == "user":
-                        messages.append(HumanMessage(content=msg["content"]))
-                    elif msg["role"] == "assistant":
-                        messages.append(AIMessage(content=msg["content"]))
-            
-            # Add the new user message
+        requests: list[tuple[str, AgentState, Optional[list[dict]]]],
+    ) -> list[tuple[str, list[ToolCall], AgentState]]:
+        """Process several user messages in one pipelined batch call.
+
+        Useful for eval harnesses and multi-agent contexts where many
+        independent conversations need a turn at once: llm.batch pipelines
+        the requests instead of paying one roundtrip each.
+
+        Args:
+            requests: list of (user_message, state, history) tuples
+
+        Returns:
+            list of (response_text, pending_tool_calls, updated_state)
+            tuples, in request order
+        """
+        if not self._llm:
+            error = "Error: Agent not initialized."
+            return [(error, [], state) for _, state, _ in requests]
+
+        batches = []
+        for user_message, state, history in requests:
+            messages = [self._SYSTEM_MSG]
+            messages.extend(
+                _ROLE_TO_MSG[m["role"]](content=m["content"])
+                for m in self._truncate_history(history or [])
+                if m["role"] in _ROLE_TO_MSG
+            )
             messages.append(HumanMessage(content=user_message))
-            
-            # Store in state
             state.messages = messages
-            state.in_tool_chain = True
-            
-            # Get response from tool LLM (functiongemma)
-            response = self._tool_llm.invoke(messages)
-            
-            # Check for tool calls
-            pending_calls = []
-            if hasattr(response, 'tool_calls') and response.tool_calls:
-                for tc in response.tool_calls:
-                    tool_name = tc["name"]
-                    arguments = tc["args"]
-                    call_id = tc.get("id", str(uuid.uuid4()))
-                    
-                    # Get the tool and create a ToolCall
-                    tool = tool_registry.get(tool_name)
-                    if tool:
-                        tool_call = tool.create_tool_call(arguments, call_id)
-                        pending_calls.append(tool_call)
-                        logger.info(f"Tool call requested: {tool_name} with args {arguments}")
-            
+            batches.append(messages)
+
+        try:
+            responses = self._llm.batch(batches, config={"max_concurrency": 8})
+        except Exception as e:
+            logger.error(f"Error processing message batch: {e}")
+            return [(f"Error: {str(e)}", [], state) for _, state, _ in requests]
+
+        results = []
+        for (user_message, state, history), response in zip(requests, responses):
+            pending_calls = self._extract_tool_calls(response, state)
+
+            state.last_ai_message = response
+            state.in_tool_chain = bool(pending_calls)
             state.pending_tool_calls = pending_calls
             state.is_waiting_for_permission = any(tc.requires_permission for tc in pending_calls)
-            
-            # Get text response (might be empty if only tool calls)
-            response_text = response.content if hasattr(response, 'content') else ""
+
+            response_text = response.content or ""
             state.current_response = response_text
-            
-            return response_text, pending_calls, state
-            
-        except Exception as e:
-            logger.error(f"Error processing tool message: {e}")
-            return f"Error: {str(e)}", [], state
-    
+
+            results.append((response_text, pending_calls, state))
+
+        return results
+
+    def _extract_tool_calls(self, response, state: AgentState) -> list[ToolCall]:
+        """Build ToolCall objects from an LLM response's tool_calls.
+
+        Identical calls (same tool, same canonical arguments) within one
+        response are collapsed to a single execution; duplicates are
+        recorded so their results can be aliased from the original.
+        """
+        pending_calls = []
+        seen: dict[tuple[str, str], str] = {}
+        if response.tool_calls:
+            for tc in response.tool_calls:
+                tool_name = tc["name"]
+                arguments = tc["args"]
+                # Lazy fallback: only mint an id when the LLM omitted one
+                call_id = tc.get("id") or state.next_id()
+
+                dedup_key = (tool_name, json.dumps(arguments, sort_keys=True, separators=(",", ":")))
+                original_id = seen.get(dedup_key)
+                if original_id is not None:
+                    state.duplicate_tool_calls[call_id] = original_id
+                    logger.info(f"Skipping duplicate tool call: {tool_name}")
+                    continue
+
+                # Get the tool and create a ToolCall
+                tool = tool_registry.get(tool_name)
+                if tool:
+                    seen[dedup_key] = call_id
+                    tool_call = tool.create_tool_call(arguments, call_id)
+                    pending_calls.append(tool_call)
+                    logger.info(f"Tool call requested: {tool_name} with args {arguments}")
+
+        return pending_calls
+
+    def _partition_pending(
+        self,
+        state: AgentState,
+        approved_call_ids: set[str],
+        denied_call_ids: set[str],
+    ) -> tuple[list[ToolCall], list[ToolCall]]:
+        """Split pending calls into (denied, to-execute) lists."""
+        denied_calls = []
+        calls_to_execute = []
+        for tool_call in state.pending_tool_calls:
+            if tool_call.call_id in denied_call_ids:
+                denied_calls.append(tool_call)
+            elif tool_call.call_id in approved_call_ids or not tool_call.requires_permission:
+                calls_to_execute.append(tool_call)
+        return denied_calls, calls_to_execute
+
+    def _collect_tool_results(
+        self,
+        state: AgentState,
+        denied_calls: list[ToolCall],
+        executed_results: dict[str, object],
+    ) -> list[_ToolInvocation]:
+        """Record execution outcomes and build the tool_results list.
+
+        Results are ordered to match state.pending_tool_calls; denied
+        calls get a synthetic failure result.
+        """
+        from kortex.core.tools import ToolResult
+
+        results_by_id = dict(executed_results)
+        for tool_call in denied_calls:
+            results_by_id[tool_call.call_id] = ToolResult(
+                success=False,
+                output="",
+                error="User denied permission for this tool call.",
+            )
+
+        for call_id, result in executed_results.items():
+            state.completed_tool_calls[call_id] = result
+
+        tool_results = []
+        for tool_call in state.pending_tool_calls:
+            result = results_by_id.get(tool_call.call_id)
+            if result is None:
+                continue
+            result_dict = result.to_dict()
+            tool_results.append(_ToolInvocation(
+                call_id=tool_call.call_id,
+                tool_name=tool_call.tool_name,
+                arguments=tool_call.arguments,
+                result=result_dict,
+            ))
+            state.tool_execution_context.append({
+                "tool_name": tool_call.tool_name,
+                "arguments": tool_call.arguments,
+                "result": result_dict,
+            })
+
+        # Alias deduplicated calls to the original's result so the model
+        # still sees a ToolMessage for every id it emitted
+        if state.duplicate_tool_calls:
+            originals = {tr.call_id: tr for tr in tool_results}
+            for dup_id, orig_id in state.duplicate_tool_calls.items():
+                original = originals.get(orig_id)
+                if original is None:
+                    continue
+                if orig_id in state.completed_tool_calls:
+                    state.completed_tool_calls[dup_id] = state.completed_tool_calls[orig_id]
+                tool_results.append(dataclasses.replace(original, call_id=dup_id))
+            state.duplicate_tool_calls = {}
+
+        # Clear pending calls
+        state.pending_tool_calls = []
+        state.is_waiting_for_permission = False
+
+        return tool_results
+
+    def _append_tool_round(self, state: AgentState, tool_results: list[_ToolInvocation]) -> list:
+        """Append the AI message and tool results to state.messages.
+
+        state.messages stays the single canonical list; appending in
+        place keeps the prompt prefix stable for server-side KV reuse.
+        """
+        messages = state.messages
+
+        if state.last_ai_message is not None:
+            # Reuse the raw AIMessage from the prior LLM response - it
+            # already carries the original tool_calls with real args
+            messages.append(state.last_ai_message)
+        else:
+            # Fallback: reconstruct the AI message from the results
+            tool_calls_for_message = [
+                {
+                    "name": tr.tool_name,
+                    "args": tr.arguments,
+                    "id": tr.call_id,
+                }
+                for tr in tool_results
+            ]
+            messages.append(AIMessage(
+                content=state.current_response or "",
+                tool_calls=tool_calls_for_message,
+            ))
+
+        # Add tool result messages; failures use LangChain's native error
+        # status instead of an "Error: " prose prefix
+        for tr in tool_results:
+            result = tr.result
+            success = result["success"]
+            tool_msg = ToolMessage(
+                content=result["output"] if success else (result["error"] or ""),
+                tool_call_id=tr.call_id,
+                status="success" if success else "error",
+            )
+            messages.append(tool_msg)
+
+        return messages
+
     def execute_tool_calls(
         self,
         state: AgentState,
@@ -359,194 +626,255 @@ class AgentService:
         denied_call_ids: set[str] = None,
         user_message: str = "",
         history: list[dict] = None,
-    ) -> tuple[str, list[ToolCall], AgentState]:
+    ) -> Generator[str, None, tuple[str, list[ToolCall], AgentState]]:
         """
         Execute approved tool calls and continue the conversation.
-        
-        Uses functiongemma for tool execution, then summarizes with selected model.
-        
+
+        Tool results are fed back to the model in a single continuation
+        call; its streamed content is the user-facing response.
+
         Returns:
             tuple of (response_text, new_pending_tool_calls, updated_state)
         """
-        if not self._tool_llm or not self._chat_llm:
+        if not self._llm:
             return "Error: Agent not initialized.", [], state
-        
+
         approved_call_ids = approved_call_ids or set()
         denied_call_ids = denied_call_ids or set()
-        
+
         # Add denied calls to state
         state.denied_tool_calls.update(denied_call_ids)
-        
-        # Execute approved tool calls
-        tool_results = []
-        for tool_call in state.pending_tool_calls:
-            call_id = tool_call.call_id
-            
-            if call_id in denied_call_ids:
-                # User denied this tool call
-                from kortex.core.tools import ToolResult
-                result = ToolResult(
-                    success=False,
-                    output="",
-                    error="User denied permission for this tool call.",
-                )
-                tool_results.append({
-                    "call_id": call_id,
-                    "tool_name": tool_call.tool_name,
-                    "arguments": tool_call.arguments,
-                    "result": result.to_dict(),
-                })
-                # Add to context for summarization
-                state.tool_execution_context.append({
-                    "tool_name": tool_call.tool_name,
-                    "arguments": tool_call.arguments,
-                    "result": result.to_dict(),
-                })
-            elif call_id in approved_call_ids or not tool_call.requires_permission:
-                # Execute the tool
-                result = tool_registry.execute_tool(
-                    tool_call.tool_name,
-                    tool_call.arguments,
-                )
-                state.completed_tool_calls[call_id] = result
-                tool_results.append({
-                    "call_id": call_id,
-                    "tool_name": tool_call.tool_name,
-                    "arguments": tool_call.arguments,
-                    "result": result.to_dict(),
-                })
-                # Add to context for summarization
-                state.tool_execution_context.append({
-                    "tool_name": tool_call.tool_name,
-                    "arguments": tool_call.arguments,
-                    "result": result.to_dict(),
-                })
-                logger.info(f"Executed tool {tool_call.tool_name}: success={result.success}")
-        
-        # Clear pending calls
-        state.pending_tool_calls = []
-        state.is_waiting_for_permission = False
-        
+
+        denied_calls, calls_to_execute = self._partition_pending(
+            state, approved_call_ids, denied_call_ids,
+        )
+
+        # Dispatch approved calls through the thread pool; independent
+        # I/O-bound tools run concurrently
+        futures = {
+            tool_call.call_id: _tool_executor.submit(_execute_tool_call_locked, tool_call)
+            for tool_call in calls_to_execute
+        }
+        for _ in as_completed(futures.values()):
+            pass
+
+        executed_results = {
+            call_id: future.result() for call_id, future in futures.items()
+        }
+        for tool_call in calls_to_execute:
+            result = executed_results[tool_call.call_id]
+            logger.info(f"Executed tool {tool_call.tool_name}: success={result.success}")
+
+        tool_results = self._collect_tool_results(state, denied_calls, executed_results)
+
         # If there were tool results, check if more tools are needed
         if tool_results:
-            return self._continue_with_tool_results(state, tool_results, user_message, history)
-        
+            return (yield from self._continue_with_tool_results(state, tool_results, user_message, history))
+
         return state.current_response, [], state
-    
+
     def _continue_with_tool_results(
         self,
         state: AgentState,
-        tool_results: list[dict],
+        tool_results: list[_ToolInvocation],
         user_message: str = "",
         history: list[dict] = None,
-    ) -> tuple[str, list[ToolCall], AgentState]:
+    ) -> Generator[str, None, tuple[str, list[ToolCall], AgentState]]:
         """Continue the conversation after tool execution.
-        
-        Uses functiongemma to determine if more tools are needed.
-        If no more tools, summarizes with the selected model.
+
+        Feeds tool results back to the model; if it requests more tools
+        they are surfaced, otherwise its streamed content is the final
+        response. Streams content chunks as they arrive.
         """
         try:
-            # Rebuild messages with tool results for functiongemma
-            messages = state.messages.copy()
-            
-            # Add an AI message with tool calls (reconstructed)
-            tool_calls_for_message = []
-            for tr in tool_results:
-                tool_calls_for_message.append({
-                    "name": tr["tool_name"],
-                    "args": tr["arguments"],
-                    "id": tr["call_id"],
-                })
-            
-            # Add AI message that requested tools
-            ai_msg = AIMessage(
-                content=state.current_response or "",
-                tool_calls=tool_calls_for_message,
-            )
-            messages.append(ai_msg)
-            
-            # Add tool result messages
-            for tr in tool_results:
-                result = tr["result"]
-                if result["success"]:
-                    content = result["output"]
-                else:
-                    content = f"Error: {result['error']}"
-                
-                tool_msg = ToolMessage(
-                    content=content,
-                    tool_call_id=tr["call_id"],
-                )
-                messages.append(tool_msg)
-            
-            # Get next response from tool LLM (functiongemma) to check for more tool calls
-            response = self._tool_llm.invoke(messages)
-            
+            messages = self._append_tool_round(state, tool_results)
+
+            # Stream the continuation, aggregating chunks to check for more
+            # tool calls at the end
+            response = None
+            for chunk in self._llm.stream(messages):
+                response = chunk if response is None else response + chunk
+                content = chunk.content
+                if content:
+                    yield content
+
+            if response is None:
+                return "", [], state
+
             # Check for more tool calls
-            pending_calls = []
-            if hasattr(response, 'tool_calls') and response.tool_calls:
-                for tc in response.tool_calls:
-                    tool_name = tc["name"]
-                    arguments = tc["args"]
-                    call_id = tc.get("id", str(uuid.uuid4()))
-                    
-                    tool = tool_registry.get(tool_name)
-                    if tool:
-                        tool_call = tool.create_tool_call(arguments, call_id)
-                        pending_calls.append(tool_call)
-                        logger.info(f"Additional tool call requested: {tool_name}")
-            
-            state.messages = messages
+            pending_calls = self._extract_tool_calls(response, state)
+
+            state.last_ai_message = response
             state.pending_tool_calls = pending_calls
             state.is_waiting_for_permission = any(tc.requires_permission for tc in pending_calls)
-            
-            response_text = response.content if hasattr(response, 'content') else ""
+
+            response_text = response.content or ""
             state.current_response = response_text
-            
+
             # If there are more tool calls, return them for execution
             if pending_calls:
                 # Auto-execute non-permission-requiring tools
                 auto_approve_calls = [tc for tc in pending_calls if not tc.requires_permission]
                 if auto_approve_calls and not state.is_waiting_for_permission:
                     auto_ids = {tc.call_id for tc in auto_approve_calls}
-                    return self.execute_tool_calls(
+                    return (yield from self.execute_tool_calls(
                         state,
                         approved_call_ids=auto_ids,
                         user_message=user_message,
                         history=history,
-                    )
-                
+                    ))
+
                 # Return pending calls that need permission
                 return response_text, pending_calls, state
-            
-            # No more tool calls - summarize with selected model
+
+            # No more tool calls - the continuation content is the answer;
+            # append it so the next turn extends the same prefix
+            messages.append(response)
             state.in_tool_chain = False
-            
-            if state.tool_execution_context:
-                # Summarize all tool results with the user's selected model
-                summary = self._summarize_tool_results(
-                    user_message or state.messages[1].content if len(state.messages) > 1 else "",
-                    state.tool_execution_context,
-                    history,
-                )
-                state.current_response = summary
-                # Clear the tool context after summarization
-                state.tool_execution_context = []
-                return summary, [], state
-            
+            state.tool_execution_context = []
+
             return response_text, [], state
-            
+
+        except Exception as e:
+            logger.error(f"Error continuing conversation: {e}")
+            return f"Error: {str(e)}", [], state
+
+    async def aprocess_message(
+        self,
+        user_message: str,
+        state: AgentState,
+        history: list[dict] = None,
+    ) -> tuple[str, list[ToolCall], AgentState]:
+        """Async variant of process_message using ainvoke.
+
+        Lets callers gather many agent turns concurrently instead of
+        blocking one thread per conversation.
+        """
+        if not self._llm:
+            return "Error: Agent not initialized. Please check if Ollama is running and required models are available.", [], state
+
+        try:
+            cache_key = self._cache_key(user_message, history)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.info("Response cache hit, skipping LLM call")
+                state.current_response = cached
+                if state.messages:
+                    state.messages.append(HumanMessage(content=user_message))
+                    state.messages.append(AIMessage(content=cached))
+                return cached, [], state
+
+            messages = self._prepare_turn_messages(user_message, state, history)
+
+            response = await self._llm.ainvoke(messages)
+
+            pending_calls = self._extract_tool_calls(response, state)
+
+            state.last_ai_message = response
+            state.in_tool_chain = bool(pending_calls)
+            state.pending_tool_calls = pending_calls
+            state.is_waiting_for_permission = any(tc.requires_permission for tc in pending_calls)
+
+            response_text = response.content or ""
+            state.current_response = response_text
+
+            if not pending_calls:
+                messages.append(response)
+                if response_text:
+                    self._cache_put(cache_key, response_text)
+
+            return response_text, pending_calls, state
+
+        except Exception as e:
+            logger.error(f"Error processing message: {e}")
+            return f"Error: {str(e)}", [], state
+
+    async def aexecute_tool_calls(
+        self,
+        state: AgentState,
+        approved_call_ids: set[str] = None,
+        denied_call_ids: set[str] = None,
+        user_message: str = "",
+        history: list[dict] = None,
+    ) -> tuple[str, list[ToolCall], AgentState]:
+        """Async variant of execute_tool_calls.
+
+        Tools run in the shared executor via run_in_executor and are
+        awaited with asyncio.gather, keeping the event loop free.
+        """
+        if not self._llm:
+            return "Error: Agent not initialized.", [], state
+
+        approved_call_ids = approved_call_ids or set()
+        denied_call_ids = denied_call_ids or set()
+
+        state.denied_tool_calls.update(denied_call_ids)
+
+        denied_calls, calls_to_execute = self._partition_pending(
+            state, approved_call_ids, denied_call_ids,
+        )
+
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*[
+            loop.run_in_executor(_tool_executor, _execute_tool_call_locked, tool_call)
+            for tool_call in calls_to_execute
+        ])
+
+        executed_results = {}
+        for tool_call, result in zip(calls_to_execute, results):
+            executed_results[tool_call.call_id] = result
+            logger.info(f"Executed tool {tool_call.tool_name}: success={result.success}")
+
+        tool_results = self._collect_tool_results(state, denied_calls, executed_results)
+
+        if tool_results:
+            return await self._acontinue_with_tool_results(state, tool_results, user_message, history)
+
+        return state.current_response, [], state
+
+    async def _acontinue_with_tool_results(
+        self,
+        state: AgentState,
+        tool_results: list[_ToolInvocation],
+        user_message: str = "",
+        history: list[dict] = None,
+    ) -> tuple[str, list[ToolCall], AgentState]:
+        """Async variant of _continue_with_tool_results using ainvoke."""
+        try:
+            messages = self._append_tool_round(state, tool_results)
+
+            response = await self._llm.ainvoke(messages)
+
+            pending_calls = self._extract_tool_calls(response, state)
+
+            state.last_ai_message = response
+            state.pending_tool_calls = pending_calls
+            state.is_waiting_for_permission = any(tc.requires_permission for tc in pending_calls)
+
+            response_text = response.content or ""
+            state.current_response = response_text
+
+            if pending_calls:
+                auto_approve_calls = [tc for tc in pending_calls if not tc.requires_permission]
+                if auto_approve_calls and not state.is_waiting_for_permission:
+                    auto_ids = {tc.call_id for tc in auto_approve_calls}
+                    return await self.aexecute_tool_calls(
+                        state,
+                        approved_call_ids=auto_ids,
+                        user_message=user_message,
+                        history=history,
+                    )
+
+                return response_text, pending_calls, state
+
+            messages.append(response)
+            state.in_tool_chain = False
+            state.tool_execution_context = []
+
+            return response_text, [], state
+
         except Exception as e:
             logger.error(f"Error continuing conversation: {e}")
-            # Try to summarize what we have
-            if state.tool_execution_context:
-                summary = self._summarize_tool_results(
-                    user_message or "",
-                    state.tool_execution_context,
-                    history,
-                )
-                state.tool_execution_context = []
-                return summary, [], state
             return f"Error: {str(e)}", [], state
 
 
@@ -557,10 +885,10 @@ _agent_service: Optional[AgentService] = None
 def get_agent_service(model_name: str = "llama3.2", host: str = "http://localhost:11434") -> AgentService:
     """Get or create the global agent service."""
     global _agent_service
-    
+
     if _agent_service is None:
         _agent_service = AgentService(model_name=model_name, host=host)
     elif _agent_service.model_name != model_name:
         _agent_service.update_model(model_name)
-    
+
     return _agent_service
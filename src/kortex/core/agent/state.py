@@ -6,16 +6,37 @@ from dataclasses import dataclass, field
 from kortex.core.tools import ToolCall, ToolResult
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentState:
-    """State for an agent conversation."""
+    """State for an agent conversation.
+
+    Uses slots to drop the per-instance __dict__; long sessions and eval
+    batches hold many of these, so the tighter layout is worth it.
+    """
     messages: list = field(default_factory=list)
     pending_tool_calls: list[ToolCall] = field(default_factory=list)
     completed_tool_calls: dict[str, ToolResult] = field(default_factory=dict)
     denied_tool_calls: set[str] = field(default_factory=set)
     is_waiting_for_permission: bool = False
     current_response: str = ""
+    # The user message that started the in-flight turn, kept for context
+    # when tool execution resumes the loop
+    user_message: str = ""
     # Track tool execution context for multi-step tool calls
     tool_execution_context: list[dict] = field(default_factory=list)
     # Track if we're in the middle of a tool chain
     in_tool_chain: bool = False
+    # Raw AIMessage from the last LLM response; carries the original
+    # tool_calls (with real args) so continuations don't rebuild it
+    last_ai_message: object = None
+    # Duplicate tool calls skipped during extraction, mapping the
+    # duplicate's call id to the id of the call that actually runs
+    duplicate_tool_calls: dict[str, str] = field(default_factory=dict)
+    # Monotonic counter for call ids we generate ourselves
+    _id_counter: int = 0
+
+    def next_id(self) -> str:
+        """Return a cheap monotonic call id for calls without an LLM id."""
+        call_id = str(self._id_counter)
+        self._id_counter += 1
+        return call_id
@@ -3,10 +3,21 @@ from __future__ import annotations
 
 import json
 import logging
-import uuid
+import re
+import time
+from collections import OrderedDict
 from typing import Optional
 
-from PySide6.QtCore import QObject, Property, Signal, Slot, QThread
+from PySide6.QtCore import (
+    QObject,
+    Property,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+    Slot,
+)
 
 from kortex.core.database import KortexDatabase
 from kortex.core.ollama_service import OllamaService, ChatMessage
@@ -16,22 +27,32 @@ from kortex.core.agent import (
     get_agent_service,
     check_required_models,
     REQUIRED_AGENT_MODELS,
-    ROUTER_MODEL,
     TOOL_MODEL,
 )
-from kortex.core.tools import ToolCall, ToolResult, tool_registry, Permission
 
 logger = logging.getLogger(__name__)
 
 
-class AgentWorker(QThread):
-    """Worker thread for handling agent requests with tool calling."""
-    
-    response_ready = Signal(str, str, list)  # chat_id, response, pending_tool_calls
+class _WorkerSignals(QObject):
+    """Signal bridge for pooled workers.
+
+    QRunnable cannot carry signals itself, so each worker owns one of
+    these. Holding every worker signal in one class keeps the pooled
+    workers lightweight and the connection sites uniform.
+    """
+
+    response_ready = Signal(str, str)  # chat_id, response
+    agent_response_ready = Signal(str, str, list)  # chat_id, response, tool call dicts
     response_chunk = Signal(str, str)  # chat_id, chunk (for streaming)
     response_error = Signal(str, str)  # chat_id, error message
-    tool_calls_ready = Signal(str, list)  # chat_id, list of tool call dicts
-    
+    execution_complete = Signal(str, str, list)  # chat_id, response, new tool call dicts
+    title_ready = Signal(str, str)  # chat_id, title
+    done = Signal()  # worker finished (success or failure)
+
+
+class AgentWorker(QRunnable):
+    """Pooled worker for handling agent requests with tool calling."""
+
     def __init__(
         self,
         agent_service: AgentService,
@@ -41,48 +62,57 @@ class AgentWorker(QThread):
         state: AgentState,
     ) -> None:
         super().__init__()
+        self.signals = _WorkerSignals()
         self._agent_service = agent_service
         self._user_message = user_message
         self._chat_id = chat_id
         self._history = history
         self._state = state
-    
+
     def run(self) -> None:
-        """Execute the agent request."""
+        """Execute the agent request, streaming chunks as they arrive."""
         try:
-            response, pending_calls, updated_state = self._agent_service.process_message(
+            generator = self._agent_service.process_message(
                 self._user_message,
                 self._state,
                 self._history,
             )
-            
+
+            # Consume the stream, emitting chunks; the final tuple comes
+            # back through StopIteration when the generator finishes
+            try:
+                while True:
+                    chunk = next(generator)
+                    if chunk:
+                        self.signals.response_chunk.emit(self._chat_id, chunk)
+            except StopIteration as stop:
+                response, pending_calls, updated_state = stop.value
+
             # Convert tool calls to serializable dicts
             tool_call_dicts = [tc.to_dict() for tc in pending_calls]
-            
-            self.response_ready.emit(self._chat_id, response, tool_call_dicts)
-            
+
+            self.signals.agent_response_ready.emit(self._chat_id, response, tool_call_dicts)
+
         except Exception as e:
             logger.error(f"Agent worker error: {e}")
-            self.response_error.emit(self._chat_id, str(e))
+            self.signals.response_error.emit(self._chat_id, str(e))
+
 
+class ToolExecutionWorker(QRunnable):
+    """Pooled worker for executing tool calls."""
 
-class ToolExecutionWorker(QThread):
-    """Worker thread for executing tool calls."""
-    
-    execution_complete = Signal(str, str, list)  # chat_id, response, new_pending_tool_calls
-    execution_error = Signal(str, str)  # chat_id, error message
-    
     def __init__(
         self,
         agent_service: AgentService,
         chat_id: str,
         state: AgentState,
-        approved_ids: set[str],
-        denied_ids: set[str],
+        approved_ids: frozenset[str],
+        denied_ids: frozenset[str],
         user_message: str = "",
         history: list[dict] = None,
     ) -> None:
         super().__init__()
+        self.signals = _WorkerSignals()
         self._agent_service = agent_service
         self._chat_id = chat_id
         self._state = state
@@ -90,33 +120,37 @@ class ToolExecutionWorker(QThread):
         self._denied_ids = denied_ids
         self._user_message = user_message
         self._history = history or []
-    
+
     def run(self) -> None:
-        """Execute the tool calls."""
+        """Execute the tool calls, streaming continuation chunks."""
         try:
-            response, new_pending, updated_state = self._agent_service.execute_tool_calls(
+            generator = self._agent_service.execute_tool_calls(
                 self._state,
                 approved_call_ids=self._approved_ids,
                 denied_call_ids=self._denied_ids,
                 user_message=self._user_message,
                 history=self._history,
             )
-            
+
+            try:
+                while True:
+                    chunk = next(generator)
+                    if chunk:
+                        self.signals.response_chunk.emit(self._chat_id, chunk)
+            except StopIteration as stop:
+                response, new_pending, updated_state = stop.value
+
             tool_call_dicts = [tc.to_dict() for tc in new_pending]
-            self.execution_complete.emit(self._chat_id, response, tool_call_dicts)
-            
+            self.signals.execution_complete.emit(self._chat_id, response, tool_call_dicts)
+
         except Exception as e:
             logger.error(f"Tool execution worker error: {e}")
-            self.execution_error.emit(self._chat_id, str(e))
+            self.signals.response_error.emit(self._chat_id, str(e))
 
 
-class ChatWorker(QThread):
-    """Worker thread for handling chat requests."""
-    
-    response_ready = Signal(str, str)  # chat_id, response
-    response_chunk = Signal(str, str)  # chat_id, chunk (for streaming)
-    response_error = Signal(str, str)  # chat_id, error message
-    
+class ChatWorker(QRunnable):
+    """Pooled worker for handling chat requests."""
+
     def __init__(
         self,
         ollama_service: OllamaService,
@@ -125,106 +159,252 @@ class ChatWorker(QThread):
         chat_id: str,
     ) -> None:
         super().__init__()
+        self.signals = _WorkerSignals()
         self._ollama_service = ollama_service
         self._model = model
         self._messages = messages
         self._chat_id = chat_id
-    
+
     def run(self) -> None:
-        """Execute the chat request."""
+        """Execute the chat request, streaming tokens as they arrive."""
         try:
-            response = self._ollama_service.chat(
+            # Emit chunks for time-to-first-token; the assembled text is
+            # only persisted once the stream completes
+            parts: list[str] = []
+            for chunk in self._ollama_service.chat_stream(
                 model=self._model,
                 messages=self._messages,
-                stream=False,
-            )
-            self.response_ready.emit(self._chat_id, response)
+            ):
+                parts.append(chunk)
+                self.signals.response_chunk.emit(self._chat_id, chunk)
+
+            self.signals.response_ready.emit(self._chat_id, "".join(parts))
         except Exception as e:
             logger.error(f"Chat worker error: {e}")
-            self.response_error.emit(self._chat_id, str(e))
+            self.signals.response_error.emit(self._chat_id, str(e))
 
 
-class TitleGeneratorWorker(QThread):
-    """Worker thread for generating chat titles in the background."""
-    
-    title_ready = Signal(str, str)  # chat_id, title
-    
+_QUOTES_TBL = str.maketrans("", "", "\"'")
+
+
+def _preview(s: str, n: int = 50) -> str:
+    """Truncate text to at most ``n`` characters with an ellipsis."""
+    return s if len(s) <= n else s[:n - 3] + "..."
+
+
+def _clean_title(s: str) -> str:
+    """Strip whitespace and quotes from a generated title and cap it."""
+    return _preview(s.strip().translate(_QUOTES_TBL).strip())
+
+
+# Built once so every title request shares a byte-identical prompt prefix,
+# which lets Ollama reuse its prompt cache across generations
+_TITLE_SINGLE_SYS = ChatMessage(
+    role="system",
+    content="Generate a very short, concise title (3-6 words max) for a conversation that starts with the following message. Only output the title, nothing else. No quotes, no explanations.",
+)
+_TITLE_BATCH_SYS = ChatMessage(
+    role="system",
+    content="You will be given several numbered conversation openers. Generate a very short, concise title (3-6 words max) for each. Only output a JSON array of the titles, in order, nothing else.",
+)
+
+
+class TitleGeneratorWorker(QRunnable):
+    """Pooled worker for generating chat titles in the background.
+
+    Accepts a batch of (chat_id, user_message) jobs; several titles
+    requested in a burst cost one Ollama round-trip instead of one each.
+    """
+
     def __init__(
         self,
         ollama_service: OllamaService,
         model: str,
-        user_message: str,
-        chat_id: str,
+        jobs: list[tuple[str, str]],
     ) -> None:
         super().__init__()
+        self.signals = _WorkerSignals()
         self._ollama_service = ollama_service
         self._model = model
-        self._user_message = user_message
-        self._chat_id = chat_id
-    
+        self._jobs = jobs
+
     def run(self) -> None:
-        """Generate a title for the chat."""
+        """Generate titles for the batched chats."""
+        try:
+            if len(self._jobs) == 1:
+                self._run_single()
+            else:
+                self._run_batch()
+        finally:
+            self.signals.done.emit()
+
+    def _run_single(self) -> None:
+        """Generate one title with the plain-text prompt."""
+        chat_id, user_message = self._jobs[0]
         try:
-            # Create a system prompt for title generation
             messages = [
-                ChatMessage(
-                    role="system",
-                    content="Generate a very short, concise title (3-6 words max) for a conversation that starts with the following message. Only output the title, nothing else. No quotes, no explanations."
-                ),
+                _TITLE_SINGLE_SYS,
                 ChatMessage(
                     role="user",
-                    content=f"Generate a title for a conversation starting with: \"{self._user_message[:200]}\""
+                    content=f"Generate a title for a conversation starting with: \"{user_message}\""
                 ),
             ]
-            
+
             response = self._ollama_service.chat(
                 model=self._model,
                 messages=messages,
                 stream=False,
             )
-            
-            # Clean up the title
-            title = response.strip().strip('"').strip("'")
-            if len(title) > 50:
-                title = title[:47] + "..."
-            
-            if title:
-                self.title_ready.emit(self._chat_id, title)
-            else:
-                # Fallback to truncated message
-                fallback = self._user_message[:50]
-                if len(self._user_message) > 50:
-                    fallback += "..."
-                self.title_ready.emit(self._chat_id, fallback)
-                
+
+            title = _clean_title(response) or _preview(user_message)
+            self.signals.title_ready.emit(chat_id, title)
+
         except Exception as e:
             logger.error(f"Title generation error: {e}")
-            # Fallback to truncated message on error
-            fallback = self._user_message[:50]
-            if len(self._user_message) > 50:
-                fallback += "..."
-            self.title_ready.emit(self._chat_id, fallback)
+            self.signals.title_ready.emit(chat_id, _preview(user_message))
+
+    def _run_batch(self) -> None:
+        """Generate all titles in one call under a shared system prompt."""
+        try:
+            numbered = "\n".join(
+                f"{i + 1}. \"{message}\""
+                for i, (_, message) in enumerate(self._jobs)
+            )
+            messages = [
+                _TITLE_BATCH_SYS,
+                ChatMessage(role="user", content=numbered),
+            ]
+
+            response = self._ollama_service.chat(
+                model=self._model,
+                messages=messages,
+                stream=False,
+            )
+            titles = self._parse_batch(response)
+
+        except Exception as e:
+            logger.error(f"Title generation error: {e}")
+            titles = []
+
+        for i, (chat_id, user_message) in enumerate(self._jobs):
+            title = _clean_title(titles[i]) if i < len(titles) else ""
+            self.signals.title_ready.emit(chat_id, title or _preview(user_message))
+
+    @staticmethod
+    def _parse_batch(response: str) -> list[str]:
+        """Extract the JSON array of titles from a batch response."""
+        start = response.find("[")
+        end = response.rfind("]")
+        if start == -1 or end <= start:
+            return []
+        try:
+            titles = json.loads(response[start:end + 1])
+        except (json.JSONDecodeError, ValueError):
+            return []
+        return [t for t in titles if isinstance(t, str)]
+
+
+class ChatPrefetchWorker(QRunnable):
+    """Warms the database message cache for a chat the user may open."""
+
+    def __init__(self, db: KortexDatabase, chat_id: str) -> None:
+        super().__init__()
+        self._db = db
+        self._chat_id = chat_id
+
+    def run(self) -> None:
+        """Fetch and discard; the point is the cache fill."""
+        try:
+            self._db.get_messages(self._chat_id)
+        except Exception as e:
+            logger.debug(f"Prefetch failed for chat {self._chat_id}: {e}")
+
+
+class TitleBatcher(QObject):
+    """Debounces title-generation jobs into batched workers.
+
+    Chats created in a burst (imports, rapid new-chat clicks) would each
+    fire their own Ollama round-trip; buffering briefly lets one worker
+    handle the whole burst with a single shared-prompt call.
+    """
+
+    title_ready = Signal(str, str)  # chat_id, title
+
+    _FLUSH_DELAY_MS = 150
+    _MAX_BATCH = 8
+
+    def __init__(self, ollama_service: OllamaService, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._ollama_service = ollama_service
+        self._model = ""
+        self._pending: list[tuple[str, str]] = []
+        self._flush_scheduled = False
+        # Keep workers alive until their done signal; the pool only owns
+        # the C++ side
+        self._workers: set[QRunnable] = set()
+
+    def enqueue(self, chat_id: str, user_message: str, model: str) -> None:
+        """Queue a title job; flushes after a short debounce window."""
+        self._model = model
+        self._pending.append((chat_id, user_message))
+        if len(self._pending) >= self._MAX_BATCH:
+            self._flush()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(self._FLUSH_DELAY_MS, self._flush)
+
+    def _flush(self) -> None:
+        """Hand the buffered jobs to a pooled worker."""
+        self._flush_scheduled = False
+        jobs, self._pending = self._pending, []
+        if not jobs:
+            return
+
+        worker = TitleGeneratorWorker(
+            ollama_service=self._ollama_service,
+            model=self._model,
+            jobs=jobs,
+        )
+        self._workers.add(worker)
+        # Direct connections run on the worker thread and skip an
+        # event-loop hop: title_ready only forwards to this signal (the
+        # GUI-thread delivery queues at the receiving connection), and
+        # the done cleanup is a GIL-atomic set discard. Slots that touch
+        # QML-visible state stay on auto/queued connections.
+        worker.signals.title_ready.connect(
+            self.title_ready, Qt.ConnectionType.DirectConnection
+        )
+        worker.signals.done.connect(
+            lambda w=worker: self._workers.discard(w),
+            Qt.ConnectionType.DirectConnection,
+        )
+        QThreadPool.globalInstance().start(worker)
 
 
 class ChatController(QObject):
     """Controller for managing chats and messages."""
-    
+
     # Signals
     chatsChanged = Signal()
+    # Incremental sidebar update: chat_id, preview, title (empty title
+    # means unchanged). Full chatsChanged reloads are kept for
+    # create/delete/reorder only
+    chatPreviewChanged = Signal(str, str, str)
     messagesChanged = Signal()
     modelsChanged = Signal()
     currentChatChanged = Signal()
     isLoadingChanged = Signal()
     responseReceived = Signal(str, str)  # chat_id, response
-    
+    responseChunk = Signal(str, str)  # chat_id, streamed chunk
+
     # Agent-related signals
     toolCallsPending = Signal(str, list)  # chat_id, list of tool call dicts
     agentModeChanged = Signal()
     agentModelsAvailableChanged = Signal()
-    
+
     def __init__(self, parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
-        
+
         self._db = KortexDatabase()
         self._ollama = OllamaService()
         self._current_chat_id: Optional[str] = None
@@ -232,168 +412,299 @@ class ChatController(QObject):
         self._agent_mode = False  # Start disabled until models are verified
         self._agent_models_available = False
         self._missing_agent_models: list[str] = []
-        self._worker: Optional[ChatWorker] = None
-        self._agent_worker: Optional[AgentWorker] = None
-        self._tool_worker: Optional[ToolExecutionWorker] = None
-        self._title_worker: Optional[TitleGeneratorWorker] = None
         self._models: list[str] = []
         self._current_model: str = ""
-        
+        # Short-TTL cache for the Ollama availability probe; sendMessage
+        # and response handlers would otherwise HTTP-probe per turn
+        self._ollama_available_cached = False
+        self._ollama_available_until = 0.0
+
+        # Reused worker threads; per-request QThread creation cost goes
+        # away and bursts of tool-loop workers share the same pool
+        self._thread_pool = QThreadPool.globalInstance()
+        # All workers block on Ollama, so a handful of reusable threads
+        # is plenty; more would just queue on the same endpoint
+        self._thread_pool.setMaxThreadCount(4)
+        # In-flight workers, keyed by (kind, chat_id); holds the Python
+        # references alive until the worker's terminal signal lands
+        self._inflight: dict[tuple[str, str], QRunnable] = {}
+
+        # Title jobs go through a debouncing batcher so bursts share one
+        # Ollama call
+        self._title_batcher = TitleBatcher(self._ollama, self)
+        self._title_batcher.title_ready.connect(self._on_title_ready)
+
+        # Agent service cached per (model, host); avoids the global
+        # lookup and model check on every hop of the agent tool loop
+        self._agent_service_cache: dict[tuple[str, str], AgentService] = {}
+
         # Agent state per chat
         self._agent_states: dict[str, AgentState] = {}
         self._pending_tool_calls: dict[str, list[dict]] = {}
+        # Precomputed per-chat flag so QML bindings don't scan the
+        # pending list on every property read
+        self._has_pending_permission: dict[str, bool] = {}
         # Store user messages for context during tool execution
-        self._user_messages: dict[str, str] = {}
-        
+        # Role/content history per chat, kept in step with DB writes so
+        # the agent loop never re-reads SQLite on the UI thread
+        self._history_cache: dict[str, list[dict]] = {}
+        # ChatMessage mirror of the history cache so regular sends don't
+        # re-allocate the whole message list every turn; LRU-bounded
+        # since entries rebuild lazily from the history cache
+        self._chat_message_cache: OrderedDict[str, list[ChatMessage]] = OrderedDict()
+        # Memoized QML list results; chatsChanged/messagesChanged make
+        # QML re-call getChats/getMessages, which shouldn't re-hit
+        # SQLite when nothing relevant changed
+        self._chats_cache: Optional[list] = None
+        self._messages_cache: dict[str, list] = {}
+
         # Load available models
         self._refresh_models()
-    
+
     def _get_agent_service(self) -> AgentService:
         """Get the agent service with current model."""
-        return get_agent_service(self._current_model, self._ollama.host)
-    
+        key = (self._current_model, self._ollama.host)
+        service = self._agent_service_cache.get(key)
+        if service is None:
+            service = get_agent_service(*key)
+            self._agent_service_cache[key] = service
+        return service
+
     def _get_or_create_agent_state(self, chat_id: str) -> AgentState:
         """Get or create agent state for a chat."""
         if chat_id not in self._agent_states:
             self._agent_states[chat_id] = self._get_agent_service().create_state()
         return self._agent_states[chat_id]
-    
+
+    _OLLAMA_AVAILABLE_TTL_S = 5.0
+
+    #: Turns of history handed to workers per message. Without a cap,
+    #: each turn copies and sends the whole chat, making long chats
+    #: quadratic in total work
+    _HISTORY_WINDOW = 20
+
+    def _window_history(self, history: list[dict]) -> list[dict]:
+        """Copy the last _HISTORY_WINDOW turns, keeping a leading system entry."""
+        if len(history) <= self._HISTORY_WINDOW:
+            return list(history)
+        anchor = [history[0]] if history[0]["role"] == "system" else []
+        return anchor + history[-self._HISTORY_WINDOW:]
+
+    def _ollama_up(self) -> bool:
+        """Check Ollama availability, cached for a few seconds."""
+        now = time.monotonic()
+        if now < self._ollama_available_until:
+            return self._ollama_available_cached
+        ok = self._ollama.is_available()
+        self._ollama_available_cached = ok
+        self._ollama_available_until = now + self._OLLAMA_AVAILABLE_TTL_S
+        return ok
+
+    def _get_history(self, chat_id: str) -> list[dict]:
+        """Get the cached role/content history, loading it once from DB."""
+        history = self._history_cache.get(chat_id)
+        if history is None:
+            history = [
+                {"role": msg.role, "content": msg.content}
+                for msg in self._db.get_messages(chat_id)
+            ]
+            self._history_cache[chat_id] = history
+        return history
+
+    #: Conversations whose ChatMessage lists stay cached; least
+    #: recently sent-to are evicted past this
+    _CHAT_MESSAGE_CACHE_MAX = 16
+
+    def _get_chat_messages(self, chat_id: str) -> list[ChatMessage]:
+        """Get the cached ChatMessage history, building it once."""
+        messages = self._chat_message_cache.get(chat_id)
+        if messages is None:
+            messages = [
+                ChatMessage(role=m["role"], content=m["content"])
+                for m in self._get_history(chat_id)
+            ]
+            self._chat_message_cache[chat_id] = messages
+            while len(self._chat_message_cache) > self._CHAT_MESSAGE_CACHE_MAX:
+                self._chat_message_cache.popitem(last=False)
+        else:
+            self._chat_message_cache.move_to_end(chat_id)
+        return messages
+
+    def _record_message(self, chat_id: str, role: str, content: str) -> None:
+        """Persist a message and keep the caches in step."""
+        message = self._db.enqueue_add_message(chat_id, role, content)
+        history = self._history_cache.get(chat_id)
+        if history is not None:
+            history.append({"role": role, "content": content})
+        chat_messages = self._chat_message_cache.get(chat_id)
+        if chat_messages is not None:
+            chat_messages.append(ChatMessage(role=role, content=content))
+        messages = self._messages_cache.get(chat_id)
+        if messages is not None:
+            messages.append({
+                "id": message.id,
+                "role": role,
+                "content": content,
+                "isUser": role == "user",
+            })
+        # The chat's preview (and ordering) changed
+        self._chats_cache = None
+
+    def _start_worker(self, kind: str, chat_id: str, worker: QRunnable) -> None:
+        """Queue a worker on the shared thread pool."""
+        self._inflight[(kind, chat_id)] = worker
+        self._thread_pool.start(worker)
+
+    def _worker_done(self, kind: str, chat_id: str) -> None:
+        """Drop the in-flight reference once a worker has reported back."""
+        self._inflight.pop((kind, chat_id), None)
+
     # Properties
     @Property(bool, notify=isLoadingChanged)
     def isLoading(self) -> bool:
         return self._is_loading
-    
+
     @isLoading.setter
     def isLoading(self, value: bool) -> None:
         if self._is_loading != value:
             self._is_loading = value
             self.isLoadingChanged.emit()
-    
+
     @Property(bool, notify=agentModeChanged)
     def agentMode(self) -> bool:
         return self._agent_mode
-    
+
     @agentMode.setter
     def agentMode(self, value: bool) -> None:
         if self._agent_mode != value:
             self._agent_mode = value
             self.agentModeChanged.emit()
-    
+
     @Property(bool, notify=agentModelsAvailableChanged)
     def agentModelsAvailable(self) -> bool:
         return self._agent_models_available
-    
+
     @Property(list, notify=agentModelsAvailableChanged)
     def missingAgentModels(self) -> list:
         return self._missing_agent_models
-    
+
     @Property(str, notify=currentChatChanged)
     def currentChatId(self) -> str:
         return self._current_chat_id or ""
-    
+
     @currentChatId.setter
     def currentChatId(self, value: str) -> None:
         if self._current_chat_id != value:
             self._current_chat_id = value if value else None
             self.currentChatChanged.emit()
             self.messagesChanged.emit()
-    
+
     @Property(str, notify=modelsChanged)
     def currentModel(self) -> str:
         return self._current_model
-    
+
     @currentModel.setter
     def currentModel(self, value: str) -> None:
         if self._current_model != value:
             self._current_model = value
             # Update current chat's model if exists
             if self._current_chat_id:
-                self._db.update_chat(self._current_chat_id, model=value)
+                self._db.enqueue_update_chat(self._current_chat_id, model=value)
+                self._chats_cache = None
             self.modelsChanged.emit()
-    
+
     # Slots
     @Slot(result=list)
     def getChats(self) -> list:
         """Get all chats with preview info."""
-        chats = self._db.get_all_chats()
+        if self._chats_cache is not None:
+            return self._chats_cache
+
         result = []
-        
-        for chat in chats:
-            last_message = self._db.get_last_message(chat.id)
-            preview = ""
-            if last_message:
-                preview = last_message.content[:50]
-                if len(last_message.content) > 50:
-                    preview += "..."
-            
+        for chat, last_content in self._db.get_all_chats_with_preview():
             result.append({
                 "id": chat.id,
                 "title": chat.title,
-                "preview": preview,
+                "preview": _preview(last_content),
                 "model": chat.model,
             })
-        
+
+        self._chats_cache = result
         return result
-    
+
     @Slot(result=list)
     def getModels(self) -> list:
         """Get list of available Ollama models."""
         return self._models
-    
+
     @Slot()
     def refreshModels(self) -> None:
         """Refresh the list of available models."""
         self._refresh_models()
-    
+
     def _refresh_models(self) -> None:
         """Internal method to refresh models."""
-        if self._ollama.is_available():
-            self._models = self._ollama.get_model_names()
+        # One /api/tags call answers both reachability and the model list
+        available_now, models = self._ollama.probe()
+        self._ollama_available_cached = available_now
+        self._ollama_available_until = time.monotonic() + self._OLLAMA_AVAILABLE_TTL_S
+        if available_now:
+            self._models = [model.name for model in models]
             if self._models and not self._current_model:
                 self._current_model = self._models[0]
-            
+
             # Check if required agent models are available
             available, missing = check_required_models(self._models)
             self._agent_models_available = available
             self._missing_agent_models = missing
-            
+
             if not available:
                 logger.warning(f"Agent mode requires models: {missing}")
                 # Disable agent mode if models are missing
                 if self._agent_mode:
                     self._agent_mode = False
                     self.agentModeChanged.emit()
-            
+
             self.agentModelsAvailableChanged.emit()
         else:
             self._models = []
             self._agent_models_available = False
             self._missing_agent_models = list(REQUIRED_AGENT_MODELS)
             logger.warning("Ollama is not available")
-        
+
         self.modelsChanged.emit()
-    
+
     @Slot(result=str)
     def createChat(self) -> str:
         """Create a new chat and return its ID."""
         chat = self._db.create_chat(model=self._current_model)
         self._current_chat_id = chat.id
+        # A new chat has no messages; seed the caches so the first
+        # getMessages never queries
+        self._history_cache[chat.id] = []
+        self._messages_cache[chat.id] = []
+        self._chats_cache = None
         self.chatsChanged.emit()
         self.currentChatChanged.emit()
         self.messagesChanged.emit()
         return chat.id
-    
+
     @Slot(str)
     def deleteChat(self, chat_id: str) -> None:
         """Delete a chat."""
         self._db.delete_chat(chat_id)
-        
+
         # Clean up agent state
         if chat_id in self._agent_states:
             del self._agent_states[chat_id]
         if chat_id in self._pending_tool_calls:
             del self._pending_tool_calls[chat_id]
-        
+        self._has_pending_permission.pop(chat_id, None)
+        self._history_cache.pop(chat_id, None)
+        self._chat_message_cache.pop(chat_id, None)
+        self._messages_cache.pop(chat_id, None)
+        self._chats_cache = None
+
         if self._current_chat_id == chat_id:
             # Select another chat or None
             chats = self._db.get_all_chats()
@@ -403,45 +714,83 @@ class ChatController(QObject):
                 self._current_chat_id = None
             self.currentChatChanged.emit()
             self.messagesChanged.emit()
-        
+
         self.chatsChanged.emit()
-    
+
     @Slot(str)
     def selectChat(self, chat_id: str) -> None:
         """Select a chat as current."""
         self.currentChatId = chat_id
-        
+
         # Update current model to match chat's model
         chat = self._db.get_chat(chat_id)
         if chat and chat.model:
             self._current_model = chat.model
             self.modelsChanged.emit()
-    
+
     @Slot(str, result=list)
     def getMessages(self, chat_id: str) -> list:
         """Get all messages for a chat."""
-        messages = self._db.get_messages(chat_id)
+        cached = self._messages_cache.get(chat_id)
+        if cached is None:
+            cached = [
+                {
+                    "id": msg.id,
+                    "role": msg.role,
+                    "content": msg.content,
+                    "isUser": msg.role == "user",
+                }
+                for msg in self._db.get_messages(chat_id)
+            ]
+            self._messages_cache[chat_id] = cached
+        return cached
+
+    # Stacked overloads make the Python defaults reachable from QML,
+    # which can't omit trailing arguments of a single registration
+    @Slot(str, result=list)
+    @Slot(str, int, result=list)
+    @Slot(str, int, str, result=list)
+    def getMessagesPage(self, chat_id: str, limit: int = 50, before_created_at: str = "") -> list:
+        """Get one page of messages for incremental loading.
+
+        Pass the createdAt of the oldest loaded message to fetch the
+        page before it; an empty string fetches the newest page.
+        """
         return [
             {
                 "id": msg.id,
                 "role": msg.role,
                 "content": msg.content,
                 "isUser": msg.role == "user",
+                "createdAt": msg.created_at,
             }
-            for msg in messages
+            for msg in self._db.get_messages_page(
+                chat_id, limit, before_created_at or None
+            )
         ]
-    
+
+    @Slot(str)
+    def prefetchChat(self, chat_id: str) -> None:
+        """Warm the message cache for a chat the pointer is hovering.
+
+        The fetched rows are dropped; by the time the user clicks, the
+        database's message cache is hot and the click is served from
+        memory.
+        """
+        if not chat_id or chat_id in self._messages_cache:
+            return
+        self._thread_pool.start(ChatPrefetchWorker(self._db, chat_id))
+
     @Slot(str, result=list)
     def getPendingToolCalls(self, chat_id: str) -> list:
         """Get pending tool calls for a chat that need user permission."""
         return self._pending_tool_calls.get(chat_id, [])
-    
+
     @Slot(str, result=bool)
     def hasPendingToolCalls(self, chat_id: str) -> bool:
         """Check if a chat has pending tool calls awaiting permission."""
-        calls = self._pending_tool_calls.get(chat_id, [])
-        return any(tc.get("requires_permission", False) for tc in calls)
-    
+        return self._has_pending_permission.get(chat_id, False)
+
     @Slot(bool)
     def setAgentMode(self, enabled: bool) -> None:
         """Enable or disable agent mode."""
@@ -450,204 +799,202 @@ class ChatController(QObject):
             logger.warning(f"Cannot enable agent mode. Missing models: {self._missing_agent_models}")
             return
         self.agentMode = enabled
-    
+
     @Slot(str, str)
     def sendMessage(self, chat_id: str, content: str) -> None:
         """Send a message and get AI response."""
         if not content.strip():
             return
-        
+
         if self._is_loading:
             return
-        
+
         # Create chat if needed
         if not chat_id:
             chat_id = self.createChat()
-        
-        # Add user message to database
-        self._db.add_message(chat_id, "user", content)
+
+        # Add user message to database (populating the history cache
+        # first so this is the only DB read on the send path)
+        history = self._get_history(chat_id)
+        self._record_message(chat_id, "user", content)
         self.messagesChanged.emit()
-        
+
         # Check if this is the first message - set temporary title
-        messages = self._db.get_messages(chat_id)
-        is_first_message = len(messages) == 1
-        
+        is_first_message = len(history) == 1
+
         if is_first_message:
             # Set a temporary title immediately so chat appears in sidebar
-            temp_title = content[:50]
-            if len(content) > 50:
-                temp_title += "..."
-            self._db.update_chat(chat_id, title=temp_title)
+            self._db.enqueue_update_chat(chat_id, title=_preview(content))
+            self._chats_cache = None
             self.chatsChanged.emit()
-        
+
         # Check if Ollama is available
-        if not self._ollama.is_available():
-            self._db.add_message(
-                chat_id, 
-                "assistant", 
+        if not self._ollama_up():
+            self._record_message(
+                chat_id,
+                "assistant",
                 "Error: Ollama is not running. Please start Ollama and try again."
             )
             self.messagesChanged.emit()
             return
-        
+
         # Check if we have a model selected
         if not self._current_model:
             if self._models:
                 self._current_model = self._models[0]
             else:
-                self._db.add_message(
+                self._record_message(
                     chat_id,
                     "assistant",
                     "Error: No models available. Please pull a model using 'ollama pull <model-name>'."
                 )
                 self.messagesChanged.emit()
                 return
-        
+
         # Start loading
         self.isLoading = True
-        
+
         # Use agent mode or regular chat
         if self._agent_mode:
-            self._send_agent_message(chat_id, content, messages)
+            self._send_agent_message(chat_id, content, history)
         else:
-            self._send_regular_message(chat_id, messages)
-    
-    def _send_agent_message(self, chat_id: str, content: str, messages: list) -> None:
+            self._send_regular_message(chat_id)
+
+    def _send_agent_message(self, chat_id: str, content: str, history: list[dict]) -> None:
         """Send a message using the agent with tool calling."""
-        # Store user message for later context during tool execution
-        self._user_messages[chat_id] = content
-        
-        # Get agent state
+        # Get agent state; it carries the user message through the tool
+        # loop for context during execution
         state = self._get_or_create_agent_state(chat_id)
-        
-        # Prepare history for agent
-        history = [
-            {"role": msg.role, "content": msg.content}
-            for msg in messages[:-1]  # Exclude the message we just added
-        ]
-        
-        # Create and start agent worker
-        self._agent_worker = AgentWorker(
+        state.user_message = content
+
+        # Window a copy excluding the message we just added; the worker
+        # must not share the live cache list
+        history = self._window_history(history[:-1])
+
+        worker = AgentWorker(
             agent_service=self._get_agent_service(),
             user_message=content,
             chat_id=chat_id,
             history=history,
             state=state,
         )
-        self._agent_worker.response_ready.connect(self._on_agent_response_ready)
-        self._agent_worker.response_error.connect(self._on_response_error)
-        self._agent_worker.finished.connect(self._on_agent_worker_finished)
-        self._agent_worker.start()
-    
-    def _send_regular_message(self, chat_id: str, messages: list) -> None:
+        worker.signals.agent_response_ready.connect(self._on_agent_response_ready)
+        # Direct: the chunk slot only re-emits, so skipping the queued
+        # hop saves an event-loop round trip per streamed token
+        worker.signals.response_chunk.connect(
+            self._on_response_chunk, Qt.ConnectionType.DirectConnection
+        )
+        worker.signals.response_error.connect(self._on_response_error)
+        self._start_worker("agent", chat_id, worker)
+
+    def _send_regular_message(self, chat_id: str) -> None:
         """Send a message using regular chat (no tools)."""
-        # Prepare messages for Ollama
-        chat_messages = [
-            ChatMessage(role=msg.role, content=msg.content)
-            for msg in messages
-        ]
-        
-        # Create and start worker thread
-        self._worker = ChatWorker(
+        # The slice copies, so the worker never shares the live cache
+        chat_messages = self._get_chat_messages(chat_id)[-self._HISTORY_WINDOW:]
+
+        worker = ChatWorker(
             ollama_service=self._ollama,
             model=self._current_model,
             messages=chat_messages,
             chat_id=chat_id,
         )
-        self._worker.response_ready.connect(self._on_response_ready)
-        self._worker.response_error.connect(self._on_response_error)
-        self._worker.finished.connect(self._on_worker_finished)
-        self._worker.start()
-    
+        worker.signals.response_ready.connect(self._on_response_ready)
+        # Direct: the chunk slot only re-emits, so skipping the queued
+        # hop saves an event-loop round trip per streamed token
+        worker.signals.response_chunk.connect(
+            self._on_response_chunk, Qt.ConnectionType.DirectConnection
+        )
+        worker.signals.response_error.connect(self._on_response_error)
+        self._start_worker("chat", chat_id, worker)
+
     def _on_agent_response_ready(self, chat_id: str, response: str, tool_calls: list) -> None:
         """Handle response from agent."""
-        # Filter tool calls that need permission
-        permission_required = [tc for tc in tool_calls if tc.get("requires_permission", False)]
-        auto_approve = [tc for tc in tool_calls if not tc.get("requires_permission", False)]
-        
+        self._worker_done("agent", chat_id)
+        self._handle_tool_calls(chat_id, response, tool_calls)
+
+    def _handle_tool_calls(self, chat_id: str, response: str, tool_calls: list) -> None:
+        """Dispatch tool calls from an agent turn.
+
+        Partitions the calls in one pass: calls needing permission pause
+        the loop and surface the permission UI, auto-approved calls run
+        immediately, and no calls at all finalizes the response.
+        """
+        permission_required = []
+        auto_approve_ids = []
+        for tc in tool_calls:
+            if tc.get("requires_permission", False):
+                permission_required.append(tc)
+            else:
+                auto_approve_ids.append(tc["call_id"])
+
         if permission_required:
             # Store pending tool calls and wait for user decision
             self._pending_tool_calls[chat_id] = tool_calls
-            
+            self._has_pending_permission[chat_id] = True
+
             # Add partial response if any
             if response:
-                self._db.add_message(chat_id, "assistant", response)
+                self._record_message(chat_id, "assistant", response)
                 self.messagesChanged.emit()
-            
+
             # Emit signal to show permission UI
             self.toolCallsPending.emit(chat_id, permission_required)
             self.isLoading = False
-            
-        elif auto_approve:
+
+        elif auto_approve_ids:
             # Execute auto-approved tools immediately
             self._pending_tool_calls[chat_id] = tool_calls
-            self._execute_tool_calls(chat_id, {tc["call_id"] for tc in auto_approve}, set())
+            self._execute_tool_calls(chat_id, frozenset(auto_approve_ids), frozenset())
         else:
             # No tool calls, just save the response
             self._finalize_response(chat_id, response)
-    
+
     def _finalize_response(self, chat_id: str, response: str) -> None:
         """Finalize the agent response."""
-        if response:
-            self._db.add_message(chat_id, "assistant", response)
-            self.messagesChanged.emit()
-            self.chatsChanged.emit()
-            self.responseReceived.emit(chat_id, response)
-        
-        # Clean up stored user message
-        if chat_id in self._user_messages:
-            del self._user_messages[chat_id]
-        
+        # Tool-only turns produce no prose; nothing was written, so skip
+        # the history check and UI signals entirely
+        if not response:
+            self.isLoading = False
+            return
+
+        self._record_message(chat_id, "assistant", response)
+        self.messagesChanged.emit()
+        self.chatPreviewChanged.emit(chat_id, _preview(response), "")
+        self.responseReceived.emit(chat_id, response)
+
         # Generate title for first message
-        messages = self._db.get_messages(chat_id)
-        if len(messages) == 2:
-            user_message = messages[0].content
-            if self._ollama.is_available() and self._current_model:
+        history = self._get_history(chat_id)
+        if len(history) == 2:
+            user_message = history[0]["content"]
+            if self._ollama_up() and self._current_model:
                 self._start_title_generation(chat_id, user_message)
-        
+
         self.isLoading = False
-    
+
     @Slot(str, list, list)
     def respondToToolCalls(self, chat_id: str, approved_ids: list, denied_ids: list) -> None:
         """Respond to pending tool call permission requests."""
-        approved_set = set(approved_ids)
-        denied_set = set(denied_ids)
-        
         self.isLoading = True
-        self._execute_tool_calls(chat_id, approved_set, denied_set)
-    
-    def _execute_tool_calls(self, chat_id: str, approved_ids: set[str], denied_ids: set[str]) -> None:
+        self._execute_tool_calls(chat_id, frozenset(approved_ids), frozenset(denied_ids))
+
+    def _execute_tool_calls(self, chat_id: str, approved_ids: frozenset[str], denied_ids: frozenset[str]) -> None:
         """Execute tool calls after user approval."""
         state = self._get_or_create_agent_state(chat_id)
-        
-        # Recreate pending tool calls from stored data
-        pending = self._pending_tool_calls.get(chat_id, [])
-        
-        state.pending_tool_calls = []
-        for tc in pending:
-            permissions = [Permission(p) for p in tc.get("permissions", [])]
-            state.pending_tool_calls.append(ToolCall(
-                tool_name=tc["tool_name"],
-                tool_description=tc["tool_description"],
-                arguments=tc["arguments"],
-                permissions=permissions,
-                requires_permission=tc["requires_permission"],
-                call_id=tc["call_id"],
-            ))
-        
+
+        # The original ToolCall objects are still on the agent state from
+        # when the model requested them; the dicts stored for QML don't
+        # need to be round-tripped back into objects here.
+
         # Clear stored pending calls
         self._pending_tool_calls[chat_id] = []
-        
-        # Get stored user message and history for context
-        user_message = self._user_messages.get(chat_id, "")
-        messages = self._db.get_messages(chat_id)
-        history = [
-            {"role": msg.role, "content": msg.content}
-            for msg in messages
-        ]
-        
-        # Create and start tool execution worker
-        self._tool_worker = ToolExecutionWorker(
+        self._has_pending_permission[chat_id] = False
+
+        # The cached history avoids a SQLite read on every approval
+        # round-trip; the user message rides on the agent state
+        user_message = state.user_message
+        history = self._window_history(self._get_history(chat_id))
+
+        worker = ToolExecutionWorker(
             agent_service=self._get_agent_service(),
             chat_id=chat_id,
             state=state,
@@ -656,107 +1003,98 @@ class ChatController(QObject):
             user_message=user_message,
             history=history,
         )
-        self._tool_worker.execution_complete.connect(self._on_tool_execution_complete)
-        self._tool_worker.execution_error.connect(self._on_response_error)
-        self._tool_worker.finished.connect(self._on_tool_worker_finished)
-        self._tool_worker.start()
-    
+        worker.signals.execution_complete.connect(self._on_tool_execution_complete)
+        # Direct: the chunk slot only re-emits, so skipping the queued
+        # hop saves an event-loop round trip per streamed token
+        worker.signals.response_chunk.connect(
+            self._on_response_chunk, Qt.ConnectionType.DirectConnection
+        )
+        worker.signals.response_error.connect(self._on_response_error)
+        self._start_worker("tools", chat_id, worker)
+
     def _on_tool_execution_complete(self, chat_id: str, response: str, new_tool_calls: list) -> None:
         """Handle tool execution completion."""
-        # Check if there are new tool calls requiring permission
-        permission_required = [tc for tc in new_tool_calls if tc.get("requires_permission", False)]
-        auto_approve = [tc for tc in new_tool_calls if not tc.get("requires_permission", False)]
-        
-        if permission_required:
-            # Store pending tool calls and wait for user decision
-            self._pending_tool_calls[chat_id] = new_tool_calls
-            
-            # Add partial response if any
-            if response:
-                self._db.add_message(chat_id, "assistant", response)
-                self.messagesChanged.emit()
-            
-            # Emit signal to show permission UI
-            self.toolCallsPending.emit(chat_id, permission_required)
-            self.isLoading = False
-            
-        elif auto_approve:
-            # Execute auto-approved tools immediately
-            self._pending_tool_calls[chat_id] = new_tool_calls
-            self._execute_tool_calls(chat_id, {tc["call_id"] for tc in auto_approve}, set())
-        else:
-            # No more tool calls, finalize response
-            self._finalize_response(chat_id, response)
-    
-    def _on_agent_worker_finished(self) -> None:
-        """Clean up after agent worker finishes."""
-        if self._agent_worker:
-            self._agent_worker.deleteLater()
-            self._agent_worker = None
-    
-    def _on_tool_worker_finished(self) -> None:
-        """Clean up after tool worker finishes."""
-        if self._tool_worker:
-            self._tool_worker.deleteLater()
-            self._tool_worker = None
-    
+        self._worker_done("tools", chat_id)
+        self._handle_tool_calls(chat_id, response, new_tool_calls)
+
+    #: Opening sentences up to this long are usable as titles directly
+    _LOCAL_TITLE_MAX = 60
+
+    @classmethod
+    def _local_title(cls, user_message: str) -> str:
+        """Derive a title from the opening sentence, or "" if unsuitable."""
+        first = re.split(r"[.!?\n]", user_message.strip(), maxsplit=1)[0].strip()
+        if 4 <= len(first) <= cls._LOCAL_TITLE_MAX:
+            return _preview(first)
+        return ""
+
     def _start_title_generation(self, chat_id: str, user_message: str) -> None:
-        """Start background title generation."""
-        self._title_worker = TitleGeneratorWorker(
-            ollama_service=self._ollama,
-            model=self._current_model,
-            user_message=user_message,
-            chat_id=chat_id,
-        )
-        self._title_worker.title_ready.connect(self._on_title_ready)
-        self._title_worker.finished.connect(self._on_title_worker_finished)
-        self._title_worker.start()
-    
+        """Title the chat, asking Ollama only when a local title won't do.
+
+        A second model round-trip per first message doubles Ollama load;
+        most openers make a fine title as-is.
+        """
+        title = self._local_title(user_message)
+        if title:
+            self._on_title_ready(chat_id, title)
+            return
+        # Truncate once here rather than in the worker
+        self._title_batcher.enqueue(chat_id, user_message[:200], self._current_model)
+
     def _on_title_ready(self, chat_id: str, title: str) -> None:
         """Handle generated title from background worker."""
         logger.info(f"Generated title for chat {chat_id}: {title}")
-        self._db.update_chat(chat_id, title=title)
+        self._db.enqueue_update_chat(chat_id, title=title)
+        self._chats_cache = None
         self.chatsChanged.emit()
-    
-    def _on_title_worker_finished(self) -> None:
-        """Clean up title worker after it finishes."""
-        if self._title_worker:
-            self._title_worker.deleteLater()
-            self._title_worker = None
-    
+
     def _on_response_ready(self, chat_id: str, response: str) -> None:
         """Handle response from Ollama."""
-        self._db.add_message(chat_id, "assistant", response)
+        self._worker_done("chat", chat_id)
+        self._record_message(chat_id, "assistant", response)
         self.messagesChanged.emit()
-        self.chatsChanged.emit()  # Update preview
+        self.chatPreviewChanged.emit(chat_id, _preview(response), "")
         self.responseReceived.emit(chat_id, response)
-        
+
         # Generate title in background after response is served (only for first message)
-        messages = self._db.get_messages(chat_id)
+        history = self._get_history(chat_id)
         # Check if this was the first user message (2 messages = 1 user + 1 assistant)
-        if len(messages) == 2:
-            user_message = messages[0].content
-            if self._ollama.is_available() and self._current_model:
+        if len(history) == 2:
+            user_message = history[0]["content"]
+            if self._ollama_up() and self._current_model:
                 self._start_title_generation(chat_id, user_message)
-    
+
+        self.isLoading = False
+
+    def _on_response_chunk(self, chat_id: str, chunk: str) -> None:
+        """Forward a streamed response chunk to the UI."""
+        self.responseChunk.emit(chat_id, chunk)
+
     def _on_response_error(self, chat_id: str, error: str) -> None:
         """Handle error from Ollama."""
-        self._db.add_message(chat_id, "assistant", f"Error: {error}")
+        for kind in ("chat", "agent", "tools"):
+            self._worker_done(kind, chat_id)
+        self._record_message(chat_id, "assistant", f"Error: {error}")
         self.messagesChanged.emit()
-    
-    def _on_worker_finished(self) -> None:
-        """Clean up after worker finishes."""
+        # Re-probe on the next turn; the failure may mean Ollama is gone
+        self._ollama_available_until = 0.0
         self.isLoading = False
-        if self._worker:
-            self._worker.deleteLater()
-            self._worker = None
-    
+
     @Slot(str)
     def setModel(self, model_name: str) -> None:
         """Set the current model."""
         self.currentModel = model_name
-    
+
     @Slot(result=bool)
     def isOllamaAvailable(self) -> bool:
         """Check if Ollama is available."""
-        return self._ollama.is_available()
+        return self._ollama_up()
+
+    @Slot()
+    def shutdown(self) -> None:
+        """Drain pending database writes before the process exits.
+
+        Connected to QApplication.aboutToQuit; without it the daemon
+        writer thread can die with queued messages still unbatched.
+        """
+        self._db.close()
@@ -1,15 +1,149 @@
 """Base Kortex database module for data persistence."""
 from __future__ import annotations
 
+import logging
+import queue
 import sqlite3
+import threading
 import uuid
-from datetime import datetime
+from collections import OrderedDict
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
 from kortex.core.database.models.chat import Chat
 from kortex.core.database.models.message import Message
 
+logger = logging.getLogger(__name__)
+
+
+# SQL kept as byte-identical module constants so sqlite3's per-connection
+# statement cache always hits instead of re-parsing
+_SQL_INSERT_MESSAGE = """
+    INSERT INTO messages (id, chat_id, role, content, created_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+#: Stored preview length; a little past the 50 chars the sidebar shows
+#: so the renderer can still decide whether an ellipsis is needed
+_PREVIEW_LEN = 64
+
+_SQL_BUMP_CHAT = "UPDATE chats SET updated_at = ?, preview = ? WHERE id = ?"
+_SQL_UPDATE_CHAT_TITLE = "UPDATE chats SET title = ?, updated_at = ? WHERE id = ?"
+_SQL_UPDATE_CHAT_MODEL = "UPDATE chats SET model = ?, updated_at = ? WHERE id = ?"
+_SQL_UPDATE_CHAT_BOTH = "UPDATE chats SET title = ?, model = ?, updated_at = ? WHERE id = ?"
+
+
+def _chat_update_sql(title: Optional[str], model: Optional[str]) -> tuple[Optional[str], list]:
+    """Pick the precompiled UPDATE variant for the fields being set."""
+    if title is not None and model is not None:
+        return _SQL_UPDATE_CHAT_BOTH, [title, model]
+    if title is not None:
+        return _SQL_UPDATE_CHAT_TITLE, [title]
+    if model is not None:
+        return _SQL_UPDATE_CHAT_MODEL, [model]
+    return None, []
+
+
+def _message_row_factory(cursor: sqlite3.Cursor, row: tuple) -> Message:
+    """Build a Message straight from a row, skipping the Row dict pass."""
+    return Message(
+        id=row[0],
+        chat_id=row[1],
+        role=row[2],
+        content=row[3],
+        created_at=row[4],
+    )
+
+
+class _WriteBatcher(threading.Thread):
+    """Background writer that groups queued writes into one transaction.
+
+    Streaming and agent tool loops issue several small writes per user
+    turn, each paying a commit (fsync) of its own. Funnelling them
+    through this thread coalesces everything queued at wake-up time into
+    a single transaction, and callers return without touching the disk.
+    """
+
+    _MAX_BATCH = 64
+
+    def __init__(self, db_path: Path) -> None:
+        super().__init__(daemon=True, name="kortex-db-writer")
+        self._db_path = db_path
+        self._queue: queue.Queue = queue.Queue()
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+
+    def submit(self, statements: list[tuple[str, tuple]]) -> None:
+        """Queue a group of statements to run in one transaction."""
+        with self._pending_lock:
+            self._pending += 1
+        self._queue.put(statements)
+
+    def flush(self) -> None:
+        """Block until every write queued so far has been committed.
+
+        Cheap no-op when nothing is outstanding, so read paths can call
+        it unconditionally to keep read-your-writes semantics.
+        """
+        with self._pending_lock:
+            if self._pending == 0:
+                return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def run(self) -> None:
+        # The writer owns its own connection; WAL lets readers proceed
+        # on their short-lived connections while a batch commits
+        conn = sqlite3.connect(str(self._db_path))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._MAX_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            # Partition up front so flush() events are always set and
+            # _pending always drops by the full write count, even when a
+            # statement (or the commit itself) fails
+            events = []
+            writes = []
+            for entry in batch:
+                if isinstance(entry, threading.Event):
+                    events.append(entry)
+                else:
+                    writes.append(entry)
+
+            try:
+                if writes:
+                    with conn:  # one commit for the whole batch
+                        for entry in writes:
+                            # A savepoint per submission keeps one bad
+                            # write (e.g. an FK violation racing a chat
+                            # delete) from discarding its co-batched
+                            # neighbours
+                            conn.execute("SAVEPOINT batch_entry")
+                            try:
+                                for sql, params in entry:
+                                    conn.execute(sql, params)
+                            except Exception as e:
+                                conn.execute("ROLLBACK TO batch_entry")
+                                logger.error(f"Batched database write failed: {e}")
+                            finally:
+                                conn.execute("RELEASE batch_entry")
+            except Exception as e:
+                logger.error(f"Batched database commit failed: {e}")
+            finally:
+                if writes:
+                    with self._pending_lock:
+                        self._pending -= len(writes)
+                for event in events:
+                    event.set()
+
 
 class KortexDatabase:
     """SQLite database for storing all Kortex data.
@@ -19,6 +153,10 @@ class KortexDatabase:
     additional data types in the future.
     """
 
+    #: Chats whose message lists are kept in memory; least recently used
+    #: entries are evicted past this
+    _MESSAGES_CACHE_MAX = 64
+
     def __init__(self, db_path: Optional[Path] = None) -> None:
         if db_path is None:
             # Default to user's data directory
@@ -27,19 +165,38 @@ class KortexDatabase:
             db_path = data_dir / "kortex.db"
         
         self.db_path = db_path
+
+        # One connection for the process lifetime; opening per call paid
+        # syscall and schema-parse overhead on every query. Qt workers
+        # share it, so every use is guarded by the lock
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # Per-connection; without it the ON DELETE CASCADE on messages
+        # is silently inert
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-20000")
+        self._lock = threading.Lock()
+
+        # Read caches: UI refreshes re-run identical queries many times
+        # between writes. Invalidated on every mutation (guarded by the
+        # same lock as the connection)
+        self._messages_cache: OrderedDict[str, list[Message]] = OrderedDict()
+        self._chat_list_cache: Optional[list[tuple[Chat, str]]] = None
+
         self._init_db()
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection with row factory."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        return conn
+        # Asynchronous write path; reads flush it first so queued
+        # writes are never invisible to a caller
+        self._writer = _WriteBatcher(self.db_path)
+        self._writer.start()
 
     def _init_db(self) -> None:
         """Initialize the database schema."""
-        conn = self._get_connection()
-        try:
-            cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
             
             # Create chats table
             cursor.execute("""
@@ -48,7 +205,8 @@ class KortexDatabase:
                     title TEXT NOT NULL,
                     model TEXT DEFAULT '',
                     created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
+                    updated_at TEXT NOT NULL,
+                    preview TEXT DEFAULT ''
                 )
             """)
             
@@ -66,222 +224,355 @@ class KortexDatabase:
             
             # Create index for faster message retrieval
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_messages_chat_id 
+                CREATE INDEX IF NOT EXISTS idx_messages_chat_id
                 ON messages(chat_id)
             """)
-            
-            conn.commit()
-        finally:
-            conn.close()
+
+            # Covering index for last-message lookups per chat
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_messages_chat_created
+                ON messages(chat_id, created_at DESC)
+            """)
+
+            # Databases from before the stored-preview column: add it
+            # and backfill from each chat's newest message
+            columns = {row[1] for row in cursor.execute("PRAGMA table_info(chats)")}
+            if "preview" not in columns:
+                cursor.execute("ALTER TABLE chats ADD COLUMN preview TEXT DEFAULT ''")
+                cursor.execute("""
+                    UPDATE chats SET preview = COALESCE(
+                        (SELECT substr(content, 1, 64) FROM messages m
+                         WHERE m.chat_id = chats.id
+                         ORDER BY created_at DESC LIMIT 1),
+                        ''
+                    )
+                """)
+
+            self._conn.commit()
 
     # ==================== Chat Operations ====================
 
     def create_chat(self, title: str = "New conversation", model: str = "") -> Chat:
         """Create a new chat."""
-        conn = self._get_connection()
-        try:
-            cursor = conn.cursor()
-            
-            chat_id = str(uuid.uuid4())
-            now = datetime.now().isoformat()
-            
-            cursor.execute(
+        chat_id = uuid.uuid4().hex
+        now = datetime.now().isoformat()
+
+        with self._lock:
+            self._conn.execute(
                 """
                 INSERT INTO chats (id, title, model, created_at, updated_at)
                 VALUES (?, ?, ?, ?, ?)
                 """,
                 (chat_id, title, model, now, now)
             )
-            
-            conn.commit()
-            
-            return Chat(
-                id=chat_id,
-                title=title,
-                model=model,
-                created_at=now,
-                updated_at=now,
-            )
-        finally:
-            conn.close()
+            self._conn.commit()
+            self._chat_list_cache = None
+
+        return Chat(
+            id=chat_id,
+            title=title,
+            model=model,
+            created_at=now,
+            updated_at=now,
+        )
 
     def get_chat(self, chat_id: str) -> Optional[Chat]:
         """Get a chat by ID."""
-        conn = self._get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM chats WHERE id = ?", (chat_id,))
-            row = cursor.fetchone()
-            
-            if row:
-                return Chat(
-                    id=row["id"],
-                    title=row["title"],
-                    model=row["model"],
-                    created_at=row["created_at"],
-                    updated_at=row["updated_at"],
-                )
-            return None
-        finally:
-            conn.close()
+        self._writer.flush()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM chats WHERE id = ?", (chat_id,)
+            ).fetchone()
+
+        if row:
+            return Chat(
+                id=row["id"],
+                title=row["title"],
+                model=row["model"],
+                created_at=row["created_at"],
+                updated_at=row["updated_at"],
+            )
+        return None
 
     def get_all_chats(self) -> list[Chat]:
         """Get all chats, ordered by most recent first."""
-        conn = self._get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute(
+        self._writer.flush()
+        with self._lock:
+            rows = self._conn.execute(
                 "SELECT * FROM chats ORDER BY updated_at DESC"
+            ).fetchall()
+
+        return [
+            Chat(
+                id=row["id"],
+                title=row["title"],
+                model=row["model"],
+                created_at=row["created_at"],
+                updated_at=row["updated_at"],
             )
-            rows = cursor.fetchall()
-            
-            return [
-                Chat(
-                    id=row["id"],
-                    title=row["title"],
-                    model=row["model"],
-                    created_at=row["created_at"],
-                    updated_at=row["updated_at"],
+            for row in rows
+        ]
+
+    def get_all_chats_with_preview(self) -> list[tuple[Chat, str]]:
+        """Get all chats with their last-message previews in one query.
+
+        Previews are maintained as a stored column on chats at write
+        time, so the sidebar refresh is a single scan of the chats
+        table with no join against messages.
+
+        Returns:
+            List of (chat, preview) tuples, most recent first; preview
+            is "" for empty chats.
+        """
+        with self._lock:
+            if self._chat_list_cache is not None:
+                return list(self._chat_list_cache)
+
+        self._writer.flush()
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT id, title, model, created_at, updated_at, preview
+                FROM chats ORDER BY updated_at DESC
+                """
+            ).fetchall()
+
+            result = [
+                (
+                    Chat(
+                        id=row["id"],
+                        title=row["title"],
+                        model=row["model"],
+                        created_at=row["created_at"],
+                        updated_at=row["updated_at"],
+                    ),
+                    row["preview"] or "",
                 )
                 for row in rows
             ]
-        finally:
-            conn.close()
+            self._chat_list_cache = result
+        return list(result)
 
     def update_chat(self, chat_id: str, title: Optional[str] = None, model: Optional[str] = None) -> bool:
         """Update a chat's title and/or model."""
-        conn = self._get_connection()
-        try:
-            cursor = conn.cursor()
-            
-            updates = []
-            params = []
-            
-            if title is not None:
-                updates.append("title = ?")
-                params.append(title)
-            
-            if model is not None:
-                updates.append("model = ?")
-                params.append(model)
-            
-            if not updates:
-                return False
-            
-            updates.append("updated_at = ?")
-            params.append(datetime.now().isoformat())
-            params.append(chat_id)
-            
-            cursor.execute(
-                f"UPDATE chats SET {', '.join(updates)} WHERE id = ?",
-                params
-            )
-            
-            conn.commit()
-            return cursor.rowcount > 0
-        finally:
-            conn.close()
+        self._writer.flush()
+
+        sql, params = _chat_update_sql(title, model)
+        if sql is None:
+            return False
+        params += [datetime.now().isoformat(), chat_id]
+
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            self._conn.commit()
+            self._chat_list_cache = None
+        return cursor.rowcount > 0
 
     def delete_chat(self, chat_id: str) -> bool:
         """Delete a chat and all its messages."""
-        conn = self._get_connection()
-        try:
-            cursor = conn.cursor()
-            
-            # Delete messages first
-            cursor.execute("DELETE FROM messages WHERE chat_id = ?", (chat_id,))
-            
-            # Delete chat
-            cursor.execute("DELETE FROM chats WHERE id = ?", (chat_id,))
-            
-            conn.commit()
-            return cursor.rowcount > 0
-        finally:
-            conn.close()
+        # Flush so a queued insert can't land after the delete
+        self._writer.flush()
+        with self._lock:
+            # Foreign keys are on, so the messages cascade in the same
+            # statement
+            cursor = self._conn.execute("DELETE FROM chats WHERE id = ?", (chat_id,))
+            self._conn.commit()
+            self._messages_cache.pop(chat_id, None)
+            self._chat_list_cache = None
+        return cursor.rowcount > 0
 
     # ==================== Message Operations ====================
 
     def add_message(self, chat_id: str, role: str, content: str) -> Message:
         """Add a message to a chat."""
-        conn = self._get_connection()
-        try:
-            cursor = conn.cursor()
-            
-            message_id = str(uuid.uuid4())
-            now = datetime.now().isoformat()
-            
-            cursor.execute(
-                """
-                INSERT INTO messages (id, chat_id, role, content, created_at)
-                VALUES (?, ?, ?, ?, ?)
-                """,
+        message_id = uuid.uuid4().hex
+        now = datetime.now().isoformat()
+
+        with self._lock:
+            self._conn.execute(
+                _SQL_INSERT_MESSAGE,
                 (message_id, chat_id, role, content, now)
             )
-            
-            # Update chat's updated_at timestamp
-            cursor.execute(
-                "UPDATE chats SET updated_at = ? WHERE id = ?",
-                (now, chat_id)
-            )
-            
-            conn.commit()
-            
-            return Message(
-                id=message_id,
-                chat_id=chat_id,
-                role=role,
-                content=content,
-                created_at=now,
+            # Update chat's updated_at timestamp and stored preview
+            self._conn.execute(_SQL_BUMP_CHAT, (now, content[:_PREVIEW_LEN], chat_id))
+            self._conn.commit()
+            self._messages_cache.pop(chat_id, None)
+            self._chat_list_cache = None
+
+        return Message(
+            id=message_id,
+            chat_id=chat_id,
+            role=role,
+            content=content,
+            created_at=now,
+        )
+
+    def add_messages_bulk(self, chat_id: str, items: list[tuple[str, str]]) -> list[Message]:
+        """Add several messages to a chat in one transaction.
+
+        Bulk paths (imports, flushing a buffered stream at end of turn)
+        pay a single commit instead of one fsync per message, plus one
+        updated_at bump for the chat.
+
+        Args:
+            items: List of (role, content) pairs, in order.
+
+        Returns:
+            The inserted messages.
+        """
+        if not items:
+            return []
+
+        # Strictly increasing timestamps keep created_at ordering
+        # unambiguous within the batch
+        base = datetime.now()
+        rows = [
+            (
+                uuid.uuid4().hex,
+                chat_id,
+                role,
+                content,
+                (base + timedelta(microseconds=i)).isoformat(),
             )
-        finally:
-            conn.close()
+            for i, (role, content) in enumerate(items)
+        ]
+        now = rows[-1][4]
+
+        with self._lock:
+            self._conn.executemany(_SQL_INSERT_MESSAGE, rows)
+            self._conn.execute(_SQL_BUMP_CHAT, (now, rows[-1][3][:_PREVIEW_LEN], chat_id))
+            self._conn.commit()
+            self._messages_cache.pop(chat_id, None)
+            self._chat_list_cache = None
+
+        return [
+            Message(id=r[0], chat_id=r[1], role=r[2], content=r[3], created_at=r[4])
+            for r in rows
+        ]
+
+    def enqueue_add_message(self, chat_id: str, role: str, content: str) -> Message:
+        """Queue a message insert on the background writer.
+
+        Returns the Message immediately with its generated id and
+        timestamp; the insert and the chat timestamp bump are committed
+        by the writer, batched with any neighbouring writes.
+        """
+        message_id = uuid.uuid4().hex
+        now = datetime.now().isoformat()
+
+        self._writer.submit([
+            (_SQL_INSERT_MESSAGE, (message_id, chat_id, role, content, now)),
+            (_SQL_BUMP_CHAT, (now, content[:_PREVIEW_LEN], chat_id)),
+        ])
+
+        with self._lock:
+            self._messages_cache.pop(chat_id, None)
+            self._chat_list_cache = None
+
+        return Message(
+            id=message_id,
+            chat_id=chat_id,
+            role=role,
+            content=content,
+            created_at=now,
+        )
+
+    def enqueue_update_chat(self, chat_id: str, title: Optional[str] = None, model: Optional[str] = None) -> None:
+        """Queue a chat title/model update on the background writer."""
+        sql, params = _chat_update_sql(title, model)
+        if sql is None:
+            return
+        params += [datetime.now().isoformat(), chat_id]
+
+        self._writer.submit([(sql, tuple(params))])
+
+        with self._lock:
+            self._chat_list_cache = None
 
     def get_messages(self, chat_id: str) -> list[Message]:
         """Get all messages for a chat, ordered by creation time."""
-        conn = self._get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM messages WHERE chat_id = ? ORDER BY created_at ASC",
+        with self._lock:
+            cached = self._messages_cache.get(chat_id)
+            if cached is not None:
+                self._messages_cache.move_to_end(chat_id)
+                return list(cached)
+
+        self._writer.flush()
+        with self._lock:
+            # A dedicated cursor with a Message row factory streams rows
+            # into dataclass instances in one pass, with the columns
+            # named so the positional mapping can't drift
+            cur = self._conn.cursor()
+            cur.row_factory = _message_row_factory
+            messages = list(cur.execute(
+                """
+                SELECT id, chat_id, role, content, created_at
+                FROM messages WHERE chat_id = ? ORDER BY created_at ASC
+                """,
                 (chat_id,)
-            )
-            rows = cursor.fetchall()
-            
-            return [
-                Message(
-                    id=row["id"],
-                    chat_id=row["chat_id"],
-                    role=row["role"],
-                    content=row["content"],
-                    created_at=row["created_at"],
-                )
-                for row in rows
-            ]
-        finally:
-            conn.close()
+            ))
+            self._messages_cache[chat_id] = messages
+            while len(self._messages_cache) > self._MESSAGES_CACHE_MAX:
+                self._messages_cache.popitem(last=False)
+        return list(messages)
+
+    def get_messages_page(
+        self,
+        chat_id: str,
+        limit: int = 50,
+        before_created_at: Optional[str] = None,
+    ) -> list[Message]:
+        """Get one page of messages, oldest first within the page.
+
+        Long chats shouldn't load in full just to show the tail; the
+        newest page paints first and older pages load as the user
+        scrolls up. The (chat_id, created_at DESC) index makes each page
+        an index range-scan.
+
+        Args:
+            limit: Maximum messages in the page.
+            before_created_at: Only messages strictly older than this
+                timestamp; None for the newest page.
+        """
+        self._writer.flush()
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.row_factory = _message_row_factory
+            if before_created_at is None:
+                rows = cur.execute(
+                    """
+                    SELECT id, chat_id, role, content, created_at
+                    FROM messages WHERE chat_id = ?
+                    ORDER BY created_at DESC LIMIT ?
+                    """,
+                    (chat_id, limit)
+                ).fetchall()
+            else:
+                rows = cur.execute(
+                    """
+                    SELECT id, chat_id, role, content, created_at
+                    FROM messages WHERE chat_id = ? AND created_at < ?
+                    ORDER BY created_at DESC LIMIT ?
+                    """,
+                    (chat_id, before_created_at, limit)
+                ).fetchall()
+
+        rows.reverse()
+        return rows
 
     def get_last_message(self, chat_id: str) -> Optional[Message]:
         """Get the last message in a chat."""
-        conn = self._get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM messages WHERE chat_id = ? ORDER BY created_at DESC LIMIT 1",
+        self._writer.flush()
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.row_factory = _message_row_factory
+            return cur.execute(
+                """
+                SELECT id, chat_id, role, content, created_at
+                FROM messages WHERE chat_id = ? ORDER BY created_at DESC LIMIT 1
+                """,
                 (chat_id,)
-            )
-            row = cursor.fetchone()
-            
-            if row:
-                return Message(
-                    id=row["id"],
-                    chat_id=row["chat_id"],
-                    role=row["role"],
-                    content=row["content"],
-                    created_at=row["created_at"],
-                )
-            return None
-        finally:
-            conn.close()
+            ).fetchone()
 
     def generate_chat_title(self, chat_id: str) -> str:
         """Generate a title based on the first user message."""
@@ -297,6 +588,17 @@ class KortexDatabase:
         
         return "New conversation"
 
+    def close(self) -> None:
+        """Drain queued writes and close the read connection.
+
+        The writer is a daemon thread, so without this a message
+        enqueued moments before quit could be lost mid-batch. Safe to
+        call more than once.
+        """
+        self._writer.flush()
+        with self._lock:
+            self._conn.close()
+
 
 # Backwards compatibility alias
 ChatDatabase = KortexDatabase
@@ -4,9 +4,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Chat:
-    """Represents a chat conversation."""
+    """Represents a chat conversation.
+
+    Slotted and frozen: one instance is built per SQLite row, so the
+    tighter layout matters for long histories.
+    """
     id: str
     title: str
     created_at: str
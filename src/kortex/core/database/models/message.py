@@ -4,9 +4,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Message:
-    """Represents a chat message."""
+    """Represents a chat message.
+
+    Slotted and frozen: one instance is built per SQLite row, so the
+    tighter layout matters for long histories.
+    """
     id: str
     chat_id: str
     role: str  # 'user' or 'assistant'
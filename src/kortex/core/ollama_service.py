@@ -2,16 +2,14 @@
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import dataclass
 from typing import Generator, Optional
 
-import ollama
-from ollama import Client
-
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class OllamaModel:
     """Represents an Ollama model."""
     name: str
@@ -28,7 +26,7 @@ class OllamaModel:
         }
 
 
-@dataclass 
+@dataclass(slots=True)
 class ChatMessage:
     """Represents a message in a chat conversation."""
     role: str  # 'user', 'assistant', or 'system'
@@ -38,50 +36,88 @@ class ChatMessage:
 class OllamaService:
     """Service for interacting with Ollama API."""
 
+    #: How long a fetched model list stays fresh. Installed models
+    #: change rarely; UI flows ask often
+    _MODELS_TTL_S = 30.0
+
     def __init__(self, host: str = "http://localhost:11434") -> None:
+        # Imported here so modules that only touch the dataclasses above
+        # don't pay the ollama/httpx import cost at startup
+        import httpx
+        from ollama import Client
+
         self.host = host
-        self._client = Client(host=host)
+        # One Client for the service's lifetime; the kwargs flow through
+        # to its underlying httpx.Client, so all workers share a warm
+        # keep-alive pool instead of paying a handshake per request.
+        # Connect fails fast; generation reads are left unbounded since
+        # streams can legitimately run for minutes
+        self._client = Client(
+            host=host,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+            timeout=httpx.Timeout(None, connect=5.0),
+        )
         self._loaded_model: Optional[str] = None
+        self._models_cache: Optional[list[OllamaModel]] = None
+        self._models_cached_at = 0.0
 
-    def is_available(self) -> bool:
-        """Check if Ollama server is running and accessible."""
+    def probe(self) -> tuple[bool, list[OllamaModel]]:
+        """Check availability and fetch models in one /api/tags call.
+
+        Probing reachability and listing models both hit the same
+        endpoint, so callers that need both should use this instead of
+        paying two round-trips. Refreshes the model TTL cache.
+        """
         try:
-            self._client.list()
-            return True
+            response = self._client.list()
         except Exception as e:
             logger.warning(f"Ollama server not available: {e}")
-            return False
+            return False, []
+
+        models = self._normalize_models(response)
+        self._models_cache = models
+        self._models_cached_at = time.monotonic()
+        return True, models
+
+    def is_available(self) -> bool:
+        """Check if Ollama server is running and accessible."""
+        return self.probe()[0]
 
     def list_models(self) -> list[OllamaModel]:
-        """List all available Ollama models."""
-        try:
-            response = self._client.list()
-            models = []
-            
-            # Handle both dict response and object response
-            model_list = response.get("models", []) if isinstance(response, dict) else getattr(response, "models", [])
-            
-            for model in model_list:
-                if isinstance(model, dict):
-                    models.append(OllamaModel(
-                        name=model.get("name", ""),
-                        size=model.get("size", 0),
-                        modified_at=model.get("modified_at", ""),
-                        digest=model.get("digest", ""),
-                    ))
-                else:
-                    # Handle object response
-                    models.append(OllamaModel(
-                        name=getattr(model, "model", "") or getattr(model, "name", ""),
-                        size=getattr(model, "size", 0),
-                        modified_at=str(getattr(model, "modified_at", "")),
-                        digest=getattr(model, "digest", ""),
-                    ))
-            
-            return models
-        except Exception as e:
-            logger.error(f"Failed to list models: {e}")
-            return []
+        """List all available Ollama models, cached for a short TTL."""
+        if (
+            self._models_cache is not None
+            and time.monotonic() - self._models_cached_at < self._MODELS_TTL_S
+        ):
+            return self._models_cache
+        return self.probe()[1]
+
+    @staticmethod
+    def _normalize_models(response) -> list[OllamaModel]:
+        """Convert a raw /api/tags response into OllamaModel entries."""
+        models = []
+
+        # Handle both dict response and object response
+        model_list = response.get("models", []) if isinstance(response, dict) else getattr(response, "models", [])
+
+        for model in model_list:
+            if isinstance(model, dict):
+                models.append(OllamaModel(
+                    name=model.get("name", ""),
+                    size=model.get("size", 0),
+                    modified_at=model.get("modified_at", ""),
+                    digest=model.get("digest", ""),
+                ))
+            else:
+                # Handle object response
+                models.append(OllamaModel(
+                    name=getattr(model, "model", "") or getattr(model, "name", ""),
+                    size=getattr(model, "size", 0),
+                    modified_at=str(getattr(model, "modified_at", "")),
+                    digest=getattr(model, "digest", ""),
+                ))
+
+        return models
 
     def get_model_names(self) -> list[str]:
         """Get a list of available model names."""
@@ -112,10 +148,9 @@ class OllamaService:
     ) -> str:
         """Send a chat message and get a response."""
         try:
-            # Ensure model is loaded
-            if not self.ensure_model_loaded(model):
-                return "Error: Failed to load the model. Please check if Ollama is running."
-
+            # No preflight load: chat() loads the model itself, and a
+            # separate empty generate() would just add a round-trip
+            # before the first token
             # Convert messages to dict format
             message_dicts = [
                 {"role": msg.role, "content": msg.content}
@@ -123,30 +158,34 @@ class OllamaService:
             ]
 
             if stream:
-                # For streaming, collect all chunks
-                full_response = ""
+                # Collect chunks in a list; += on a str re-copies the
+                # whole accumulated response per chunk
+                parts: list[str] = []
                 for chunk in self._client.chat(
                     model=model,
                     messages=message_dicts,
                     stream=True,
+                    keep_alive="5m",
                 ):
                     # Handle both dict and object response
                     if isinstance(chunk, dict):
-                        if "message" in chunk and "content" in chunk["message"]:
-                            full_response += chunk["message"]["content"]
+                        content = chunk.get("message", {}).get("content", "")
                     else:
                         message = getattr(chunk, "message", None)
-                        if message:
-                            content = getattr(message, "content", "")
-                            full_response += content
-                return full_response
+                        content = getattr(message, "content", "") if message else ""
+                    if content:
+                        parts.append(content)
+                self._loaded_model = model
+                return "".join(parts)
             else:
                 # Non-streaming response
                 response = self._client.chat(
                     model=model,
                     messages=message_dicts,
                     stream=False,
+                    keep_alive="5m",
                 )
+                self._loaded_model = model
                 # Handle both dict and object response
                 if isinstance(response, dict):
                     return response.get("message", {}).get("content", "")
@@ -167,32 +206,43 @@ class OllamaService:
     ) -> Generator[str, None, None]:
         """Stream a chat response."""
         try:
-            # Ensure model is loaded
-            if not self.ensure_model_loaded(model):
-                yield "Error: Failed to load the model. Please check if Ollama is running."
-                return
-
+            # As in chat(): the request itself loads the model, so skip
+            # the preflight round-trip
             # Convert messages to dict format
             message_dicts = [
                 {"role": msg.role, "content": msg.content}
                 for msg in messages
             ]
 
-            for chunk in self._client.chat(
+            it = iter(self._client.chat(
                 model=model,
                 messages=message_dicts,
                 stream=True,
-            ):
-                # Handle both dict and object response
-                if isinstance(chunk, dict):
-                    if "message" in chunk and "content" in chunk["message"]:
-                        yield chunk["message"]["content"]
-                else:
-                    message = getattr(chunk, "message", None)
-                    if message:
-                        content = getattr(message, "content", "")
-                        if content:
-                            yield content
+                keep_alive="5m",
+            ))
+
+            # Every chunk in a stream has the same shape; decide dict vs
+            # object once on the first one and bind a plain extractor so
+            # the per-token loop does no isinstance/getattr work
+            first = next(it, None)
+            if first is None:
+                return
+            self._loaded_model = model
+            if isinstance(first, dict):
+                def extract(c: dict) -> str:
+                    return c.get("message", {}).get("content", "")
+            else:
+                def extract(c) -> str:
+                    message = getattr(c, "message", None)
+                    return getattr(message, "content", "") if message else ""
+
+            content = extract(first)
+            if content:
+                yield content
+            for chunk in it:
+                content = extract(chunk)
+                if content:
+                    yield content
 
         except Exception as e:
             logger.error(f"Chat stream error: {e}")
@@ -203,6 +253,8 @@ class OllamaService:
         try:
             for progress in self._client.pull(model_name, stream=True):
                 yield progress
+            # The installed set changed; refetch on the next list
+            self._models_cache = None
         except Exception as e:
             logger.error(f"Failed to pull model '{model_name}': {e}")
             yield {"error": str(e)}
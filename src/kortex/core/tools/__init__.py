@@ -5,11 +5,29 @@ from kortex.core.tools.base import (
     ToolCall,
     BaseTool,
 )
-from kortex.core.tools.read_dir import ReadDirectoryTool
-from kortex.core.tools.read_file import ReadFileTool
-from kortex.core.tools.write_file import WriteFileTool
-from kortex.core.tools.run_cmd import RunCommandTool
-from kortex.core.tools.registry import ToolRegistry, tool_registry
+
+
+def __getattr__(name: str):
+    # The concrete tools and the registry (which instantiates them all)
+    # resolve lazily so importing the package for the base types alone
+    # stays cheap
+    if name in ("ReadDirectoryTool",):
+        from kortex.core.tools.read_dir import ReadDirectoryTool
+        return ReadDirectoryTool
+    if name in ("ReadFileTool",):
+        from kortex.core.tools.read_file import ReadFileTool
+        return ReadFileTool
+    if name in ("WriteFileTool",):
+        from kortex.core.tools.write_file import WriteFileTool
+        return WriteFileTool
+    if name in ("RunCommandTool",):
+        from kortex.core.tools.run_cmd import RunCommandTool
+        return RunCommandTool
+    if name in ("ToolRegistry", "tool_registry"):
+        from kortex.core.tools import registry
+        return getattr(registry, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "Permission",
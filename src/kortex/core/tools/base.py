@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Optional
 
@@ -20,36 +20,44 @@ class Permission(Enum):
     @property
     def requires_explicit_permission(self) -> bool:
         """Check if this permission requires explicit user approval."""
-        return self in {
-            Permission.FS_WRITE,
-            Permission.INTERNET,
-            Permission.RUN_CMD,
-        }
+        return self in _EXPLICIT_PERMISSIONS
     
     @property
     def display_name(self) -> str:
         """Human-readable name for the permission."""
-        names = {
-            Permission.FS_READ: "Read Files",
-            Permission.FS_WRITE: "Write Files",
-            Permission.INTERNET: "Internet Access",
-            Permission.RUN_CMD: "Run Commands",
-        }
-        return names.get(self, self.value)
+        return _PERMISSION_NAMES.get(self, self.value)
     
     @property
     def description(self) -> str:
         """Description of what this permission allows."""
-        descriptions = {
-            Permission.FS_READ: "Read files and directories from your system",
-            Permission.FS_WRITE: "Create or modify files on your system",
-            Permission.INTERNET: "Access the internet to fetch data",
-            Permission.RUN_CMD: "Execute shell commands on your system",
-        }
-        return descriptions.get(self, "Unknown permission")
+        return _PERMISSION_DESCRIPTIONS.get(self, "Unknown permission")
+
+
+# Permission metadata lives at module scope; the properties are hit for
+# every ToolCall.to_dict and permission card render, and rebuilding the
+# dicts per access was pure allocation churn
+_EXPLICIT_PERMISSIONS = frozenset({
+    Permission.FS_WRITE,
+    Permission.INTERNET,
+    Permission.RUN_CMD,
+})
+
+_PERMISSION_NAMES = {
+    Permission.FS_READ: "Read Files",
+    Permission.FS_WRITE: "Write Files",
+    Permission.INTERNET: "Internet Access",
+    Permission.RUN_CMD: "Run Commands",
+}
+
+_PERMISSION_DESCRIPTIONS = {
+    Permission.FS_READ: "Read files and directories from your system",
+    Permission.FS_WRITE: "Create or modify files on your system",
+    Permission.INTERNET: "Access the internet to fetch data",
+    Permission.RUN_CMD: "Execute shell commands on your system",
+}
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Result from a tool execution."""
     success: bool
@@ -64,7 +72,7 @@ class ToolResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """Represents a pending tool call that may need permission."""
     tool_name: str
@@ -73,15 +81,26 @@ class ToolCall:
     permissions: list[Permission]
     requires_permission: bool
     call_id: str = ""
-    
+    # Derived views of `permissions`; create_tool_call passes the lists
+    # cached on the tool class so to_dict never recomputes them
+    permission_values: list[str] = field(default_factory=list)
+    permission_names: list[str] = field(default_factory=list)
+    permission_descriptions: list[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if self.permissions and not self.permission_values:
+            self.permission_values = [p.value for p in self.permissions]
+            self.permission_names = [p.display_name for p in self.permissions]
+            self.permission_descriptions = [p.description for p in self.permissions]
+
     def to_dict(self) -> dict:
         return {
             "tool_name": self.tool_name,
             "tool_description": self.tool_description,
             "arguments": self.arguments,
-            "permissions": [p.value for p in self.permissions],
-            "permission_names": [p.display_name for p in self.permissions],
-            "permission_descriptions": [p.description for p in self.permissions],
+            "permissions": self.permission_values,
+            "permission_names": self.permission_names,
+            "permission_descriptions": self.permission_descriptions,
             "requires_permission": self.requires_permission,
             "call_id": self.call_id,
         }
@@ -93,11 +112,29 @@ class BaseTool(ABC):
     name: str
     description: str
     permissions: list[Permission]
-    
+
+    # Computed per subclass; permissions are fixed at class definition,
+    # so there is no need to rescan them per tool-call construction
+    _requires_explicit: bool = False
+    _perm_values: list[str] = []
+    _perm_names: list[str] = []
+    _perm_descriptions: list[str] = []
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        permissions = getattr(cls, "permissions", None)
+        if permissions is not None:
+            cls._requires_explicit = any(
+                p in _EXPLICIT_PERMISSIONS for p in permissions
+            )
+            cls._perm_values = [p.value for p in permissions]
+            cls._perm_names = [p.display_name for p in permissions]
+            cls._perm_descriptions = [p.description for p in permissions]
+
     @property
     def requires_explicit_permission(self) -> bool:
         """Check if any permission requires explicit approval."""
-        return any(p.requires_explicit_permission for p in self.permissions)
+        return self._requires_explicit
     
     @abstractmethod
     def execute(self, **kwargs) -> ToolResult:
@@ -118,4 +155,7 @@ class BaseTool(ABC):
             permissions=self.permissions,
             requires_permission=self.requires_explicit_permission,
             call_id=call_id,
+            permission_values=self._perm_values,
+            permission_names=self._perm_names,
+            permission_descriptions=self._perm_descriptions,
         )
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import logging
-from pathlib import Path
+import os
+import stat
 
 from kortex.core.tools.base import BaseTool, Permission, ToolResult
 
@@ -29,41 +30,80 @@ class ReadDirectoryTool(BaseTool):
                     "description": "Whether to include hidden files (starting with .)",
                     "default": False,
                 },
+                "max_entries": {
+                    "type": "integer",
+                    "description": "Maximum number of entries to list (default: 1000)",
+                    "default": 1000,
+                },
             },
             "required": ["path"],
         }
-    
-    def execute(self, path: str, show_hidden: bool = False) -> ToolResult:
+
+    def execute(
+        self,
+        path: str,
+        show_hidden: bool = False,
+        max_entries: int = 1000,
+    ) -> ToolResult:
         """List directory contents."""
         try:
-            target_path = Path(path).expanduser().resolve()
-            
-            if not target_path.exists():
+            # expanduser is a pure string op; resolve() would stat every
+            # component for nothing since scandir validates the path
+            target_path = os.path.expanduser(path)
+
+            # One stat answers existence and type; exists() + is_dir()
+            # would stat the same inode twice
+            try:
+                st = os.stat(target_path)
+            except FileNotFoundError:
                 return ToolResult(
                     success=False,
                     output="",
                     error=f"Directory does not exist: {path}",
                 )
-            
-            if not target_path.is_dir():
+
+            if not stat.S_ISDIR(st.st_mode):
                 return ToolResult(
                     success=False,
                     output="",
                     error=f"Path is not a directory: {path}",
                 )
             
+            # scandir caches type and stat per entry, so listing costs
+            # one syscall per entry instead of three or four; stopping
+            # at max_entries keeps memory and output bounded on huge
+            # directories
+            truncated = False
+            raw = []
+            with os.scandir(target_path) as it:
+                for e in it:
+                    if not show_hidden and e.name.startswith("."):
+                        continue
+                    if len(raw) >= max_entries:
+                        truncated = True
+                        break
+                    raw.append(e)
+            if not truncated:
+                # Under the cap we saw everything, so sorted output is
+                # meaningful; a sorted prefix of a partial scan isn't
+                raw.sort(key=lambda e: e.name)
+
             entries = []
-            for entry in sorted(target_path.iterdir()):
-                if not show_hidden and entry.name.startswith("."):
-                    continue
-                
+            for entry in raw:
+                # Follow symlinks so a link to a directory renders as
+                # [dir] like the target it resolves to; DirEntry still
+                # answers from the readdir type info for non-symlinks,
+                # so only actual symlinks pay a stat
                 entry_type = "dir" if entry.is_dir() else "file"
                 size = ""
                 if entry.is_file():
                     size = f" ({entry.stat().st_size} bytes)"
-                
+
                 entries.append(f"[{entry_type}] {entry.name}{size}")
-            
+
+            if truncated:
+                entries.append(f"... (truncated, showing first {max_entries} entries)")
+
             if not entries:
                 output = f"Directory '{path}' is empty."
             else:
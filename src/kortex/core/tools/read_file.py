@@ -2,13 +2,56 @@
 from __future__ import annotations
 
 import logging
-from pathlib import Path
+import os
+import stat
+from functools import lru_cache
 
 from kortex.core.tools.base import BaseTool, Permission, ToolResult
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _read_capped(path: str, mtime_ns: int, size: int, max_lines: int) -> str:
+    """Read up to max_lines of a file, cached per content version.
+
+    Agents re-read the same files across a conversation; keying on
+    (mtime_ns, size) means any edit misses the cache naturally while
+    repeat reads skip the open/decode entirely.
+    """
+    # The size cap keeps the whole file comfortably in memory and the
+    # stat already told us how much to ask for, so a raw descriptor
+    # read skips the BufferedReader layer; the loop only matters for
+    # the rare short read
+    fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        chunks = []
+        remaining = size
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+    finally:
+        os.close(fd)
+    raw = b"".join(chunks)
+
+    # A NUL byte is the cheap, reliable binary tell (one C-level scan);
+    # mere non-UTF-8 sequences in an otherwise text file get replaced
+    # rather than failing the whole read
+    if b"\x00" in raw:
+        raise UnicodeDecodeError("utf-8", raw[:16], 0, 1, "file contains NUL bytes")
+    try:
+        data = raw.decode("utf-8")
+    except UnicodeDecodeError:
+        data = raw.decode("utf-8", errors="replace")
+    lines = [line.rstrip() for line in data.splitlines()[:max_lines + 1]]
+    if len(lines) > max_lines:
+        lines[max_lines:] = [f"\n... (truncated, showing first {max_lines} lines)"]
+    return "\n".join(lines)
+
+
 class ReadFileTool(BaseTool):
     """Tool to read contents of a file."""
     
@@ -36,24 +79,30 @@ class ReadFileTool(BaseTool):
     def execute(self, path: str, max_lines: int = 500) -> ToolResult:
         """Read file contents."""
         try:
-            target_path = Path(path).expanduser().resolve()
-            
-            if not target_path.exists():
+            # expanduser is a pure string op; resolve() would stat every
+            # path component only to produce a path open() validates
+            # anyway
+            target_path = os.path.expanduser(path)
+
+            # One stat answers existence, type and size; exists() +
+            # is_file() + stat() would hit the same inode three times
+            try:
+                st = os.stat(target_path)
+            except FileNotFoundError:
                 return ToolResult(
                     success=False,
                     output="",
                     error=f"File does not exist: {path}",
                 )
-            
-            if not target_path.is_file():
+
+            if not stat.S_ISREG(st.st_mode):
                 return ToolResult(
                     success=False,
                     output="",
                     error=f"Path is not a file: {path}",
                 )
-            
-            # Check file size first
-            file_size = target_path.stat().st_size
+
+            file_size = st.st_size
             if file_size > 1_000_000:  # 1MB limit
                 return ToolResult(
                     success=False,
@@ -63,18 +112,12 @@ class ReadFileTool(BaseTool):
             
             # Try to read as text
             try:
-                with open(target_path, "r", encoding="utf-8") as f:
-                    lines = []
-                    for i, line in enumerate(f):
-                        if i >= max_lines:
-                            lines.append(f"\n... (truncated, showing first {max_lines} lines)")
-                            break
-                        lines.append(line.rstrip())
-                    
-                    content = "\n".join(lines)
-                    output = f"Contents of '{path}':\n```\n{content}\n```"
-                    return ToolResult(success=True, output=output)
-                    
+                content = _read_capped(
+                    target_path, st.st_mtime_ns, file_size, max_lines
+                )
+                output = f"Contents of '{path}':\n```\n{content}\n```"
+                return ToolResult(success=True, output=output)
+
             except UnicodeDecodeError:
                 return ToolResult(
                     success=False,
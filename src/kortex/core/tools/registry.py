@@ -1,14 +1,11 @@
 """Registry for managing available tools."""
 from __future__ import annotations
 
+import inspect
 import logging
 from typing import Optional
 
 from kortex.core.tools.base import BaseTool, ToolResult
-from kortex.core.tools.read_dir import ReadDirectoryTool
-from kortex.core.tools.read_file import ReadFileTool
-from kortex.core.tools.write_file import WriteFileTool
-from kortex.core.tools.run_cmd import RunCommandTool
 
 logger = logging.getLogger(__name__)
 
@@ -17,11 +14,24 @@ class ToolRegistry:
     """Registry for managing available tools."""
     
     def __init__(self) -> None:
-        self._tools: dict[str, BaseTool] = {}
+        # Each entry carries the tool, its OpenAI-format schema and the
+        # execute() signature, all built once at registration so the
+        # hot paths never call back into the tools
+        self._tools: dict[str, tuple[BaseTool, dict, inspect.Signature]] = {}
+        # Schemas go out with every agent request; built lazily once and
+        # dropped whenever the tool set changes
+        self._schemas_cache: Optional[list[dict]] = None
         self._register_default_tools()
     
     def _register_default_tools(self) -> None:
         """Register the default set of tools."""
+        # Imported here rather than at module scope so importing the
+        # tools package stays cheap for processes that never run a tool
+        from kortex.core.tools.read_dir import ReadDirectoryTool
+        from kortex.core.tools.read_file import ReadFileTool
+        from kortex.core.tools.run_cmd import RunCommandTool
+        from kortex.core.tools.write_file import WriteFileTool
+
         self.register(ReadDirectoryTool())
         self.register(ReadFileTool())
         self.register(WriteFileTool())
@@ -29,43 +39,49 @@ class ToolRegistry:
     
     def register(self, tool: BaseTool) -> None:
         """Register a tool."""
-        self._tools[tool.name] = tool
+        schema = {
+            "type": "function",
+            "function": {
+                "name": tool.name,
+                "description": tool.description,
+                "parameters": tool.get_schema(),
+            },
+        }
+        self._tools[tool.name] = (tool, schema, inspect.signature(tool.execute))
+        self._schemas_cache = None
         logger.info(f"Registered tool: {tool.name}")
-    
+
     def get(self, name: str) -> Optional[BaseTool]:
         """Get a tool by name."""
-        return self._tools.get(name)
-    
+        entry = self._tools.get(name)
+        return entry[0] if entry else None
+
     def get_all(self) -> list[BaseTool]:
         """Get all registered tools."""
-        return list(self._tools.values())
-    
+        return [tool for tool, _, _ in self._tools.values()]
+
     def get_tool_schemas(self) -> list[dict]:
         """Get schemas for all tools in OpenAI function format."""
-        schemas = []
-        for tool in self._tools.values():
-            schemas.append({
-                "type": "function",
-                "function": {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": tool.get_schema(),
-                },
-            })
-        return schemas
-    
+        if self._schemas_cache is None:
+            self._schemas_cache = [s for _, s, _ in self._tools.values()]
+        return self._schemas_cache
+
     def execute_tool(self, name: str, arguments: dict) -> ToolResult:
         """Execute a tool by name with given arguments."""
-        tool = self.get(name)
-        if not tool:
+        entry = self._tools.get(name)
+        if not entry:
             return ToolResult(
                 success=False,
                 output="",
                 error=f"Unknown tool: {name}",
             )
-        
+        tool, _, sig = entry
+
+        # Validate arguments against the precomputed signature up front
+        # so a TypeError raised inside the tool isn't mistaken for a
+        # bad-arguments error
         try:
-            return tool.execute(**arguments)
+            sig.bind(**arguments)
         except TypeError as e:
             return ToolResult(
                 success=False,
@@ -73,6 +89,8 @@ class ToolRegistry:
                 error=f"Invalid arguments for tool {name}: {e}",
             )
 
+        return tool.execute(**arguments)
+
 
 # Global tool registry instance
 tool_registry = ToolRegistry()
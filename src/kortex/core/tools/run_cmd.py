@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import logging
-import subprocess
-from pathlib import Path
+import os
+import selectors
+import time
 from typing import Optional
 
 from kortex.core.tools.base import BaseTool, Permission, ToolResult
@@ -14,6 +15,14 @@ logger = logging.getLogger(__name__)
 class RunCommandTool(BaseTool):
     """Tool to execute shell commands."""
     
+    #: Most output kept per stream; chatty commands are drained but no
+    #: longer buffered once past this, so memory stays bounded
+    MAX_CAPTURE_BYTES = 64 * 1024
+
+    #: Total bytes a command may emit before it is killed outright; a
+    #: runaway process shouldn't keep us draining for its whole timeout
+    HARD_CAP_BYTES = 10 * 1024 * 1024
+
     name = "run_cmd"
     description = "Execute a shell command and return its output. Use for running scripts, installing packages, or system operations. Be careful with destructive commands."
     permissions = [Permission.RUN_CMD]
@@ -46,53 +55,80 @@ class RunCommandTool(BaseTool):
         timeout: int = 30,
     ) -> ToolResult:
         """Execute a shell command."""
+        # Deferred so importing the tools package stays cheap when no
+        # command is ever run
+        import subprocess
+
         try:
             cwd = None
             if working_dir:
-                cwd = Path(working_dir).expanduser().resolve()
-                if not cwd.exists():
+                # String expansion plus one isdir stat; resolve() would
+                # stat every component on top
+                cwd = os.path.expanduser(working_dir)
+                if not os.path.isdir(cwd):
                     return ToolResult(
                         success=False,
                         output="",
                         error=f"Working directory does not exist: {working_dir}",
                     )
             
-            # Run the command
-            result = subprocess.run(
+            # Run the command, reading both pipes incrementally so a
+            # chatty command can't grow an unbounded capture buffer
+            proc = subprocess.Popen(
                 command,
                 shell=True,
                 cwd=cwd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
             )
-            
+            try:
+                stdout, stderr, timed_out, over_cap = self._drain(proc, timeout)
+            finally:
+                if proc.poll() is None:
+                    proc.kill()
+                proc.wait()
+
+            if timed_out:
+                return ToolResult(
+                    success=False,
+                    output="",
+                    error=f"Command timed out after {timeout} seconds",
+                )
+
+            if over_cap:
+                output_parts = []
+                if stdout:
+                    output_parts.append(f"stdout:\n{stdout}")
+                if stderr:
+                    output_parts.append(f"stderr:\n{stderr}")
+                return ToolResult(
+                    success=False,
+                    output="\n".join(output_parts),
+                    error=(
+                        f"Command killed: output exceeded "
+                        f"{self.HARD_CAP_BYTES} bytes"
+                    ),
+                )
+
             output_parts = []
-            if result.stdout:
-                output_parts.append(f"stdout:\n{result.stdout}")
-            if result.stderr:
-                output_parts.append(f"stderr:\n{result.stderr}")
-            
+            if stdout:
+                output_parts.append(f"stdout:\n{stdout}")
+            if stderr:
+                output_parts.append(f"stderr:\n{stderr}")
+
             output = "\n".join(output_parts) if output_parts else "(no output)"
-            
-            if result.returncode != 0:
+
+            if proc.returncode != 0:
                 return ToolResult(
                     success=False,
                     output=output,
-                    error=f"Command exited with code {result.returncode}",
+                    error=f"Command exited with code {proc.returncode}",
                 )
-            
+
             return ToolResult(
                 success=True,
                 output=f"Command executed successfully:\n{output}",
             )
-            
-        except subprocess.TimeoutExpired:
-            return ToolResult(
-                success=False,
-                output="",
-                error=f"Command timed out after {timeout} seconds",
-            )
         except Exception as e:
             logger.error(f"Error executing command '{command}': {e}")
             return ToolResult(
@@ -100,3 +136,67 @@ class RunCommandTool(BaseTool):
                 output="",
                 error=str(e),
             )
+
+    def _drain(
+        self,
+        proc: subprocess.Popen,
+        timeout: int,
+    ) -> tuple[str, str, bool, bool]:
+        """Read both pipes until EOF, deadline or hard cap.
+
+        Returns (stdout, stderr, timed_out, over_cap); past the capture
+        cap chunks are still read, to keep the child from blocking on a
+        full pipe, but dropped. Past HARD_CAP_BYTES total the child is
+        killed instead of drained for the rest of its timeout.
+        """
+        import subprocess
+
+        chunks: dict[str, list[bytes]] = {"stdout": [], "stderr": []}
+        sizes = {"stdout": 0, "stderr": 0}
+        total = 0
+        deadline = time.monotonic() + timeout
+
+        sel = selectors.DefaultSelector()
+        sel.register(proc.stdout, selectors.EVENT_READ, "stdout")
+        sel.register(proc.stderr, selectors.EVENT_READ, "stderr")
+
+        try:
+            while sel.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return "", "", True, False
+                for key, _ in sel.select(remaining):
+                    data = os.read(key.fileobj.fileno(), 4096)
+                    if not data:
+                        sel.unregister(key.fileobj)
+                        continue
+                    total += len(data)
+                    name = key.data
+                    if sizes[name] < self.MAX_CAPTURE_BYTES:
+                        chunks[name].append(data)
+                        sizes[name] += len(data)
+                if total > self.HARD_CAP_BYTES:
+                    proc.kill()
+                    return self._text(chunks, sizes, "stdout"), self._text(chunks, sizes, "stderr"), False, True
+        finally:
+            sel.close()
+
+        remaining = deadline - time.monotonic()
+        try:
+            proc.wait(max(remaining, 0))
+        except subprocess.TimeoutExpired:
+            return "", "", True, False
+
+        return self._text(chunks, sizes, "stdout"), self._text(chunks, sizes, "stderr"), False, False
+
+    def _text(
+        self,
+        chunks: dict[str, list[bytes]],
+        sizes: dict[str, int],
+        name: str,
+    ) -> str:
+        """Join and decode a captured stream, marking truncation."""
+        text = b"".join(chunks[name]).decode("utf-8", errors="replace")
+        if sizes[name] >= self.MAX_CAPTURE_BYTES:
+            text += "\n... (output truncated)"
+        return text
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from pathlib import Path
+import os
 
 from kortex.core.tools.base import BaseTool, Permission, ToolResult
 
@@ -40,16 +40,36 @@ class WriteFileTool(BaseTool):
     def execute(self, path: str, content: str, append: bool = False) -> ToolResult:
         """Write content to a file."""
         try:
-            target_path = Path(path).expanduser().resolve()
-            
+            # expanduser is a pure string op; resolve() would stat every
+            # component only to produce a path os.open validates anyway
+            target_path = os.path.expanduser(path)
+
             # Create parent directories if needed
-            target_path.parent.mkdir(parents=True, exist_ok=True)
+            parent = os.path.dirname(target_path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
             
-            mode = "a" if append else "w"
             action = "Appended to" if append else "Wrote to"
-            
-            with open(target_path, mode, encoding="utf-8") as f:
-                f.write(content)
+
+            # Encode once and push the bytes straight through os.write;
+            # a text-mode file object would re-encode and copy through
+            # its 8 KB buffer, which adds up on multi-MB payloads
+            # O_CLOEXEC keeps the descriptor from leaking into commands
+            # run_cmd may spawn concurrently
+            flags = (
+                os.O_WRONLY
+                | os.O_CREAT
+                | os.O_CLOEXEC
+                | (os.O_APPEND if append else os.O_TRUNC)
+            )
+            fd = os.open(target_path, flags, 0o644)
+            try:
+                view = memoryview(content.encode("utf-8"))
+                while view:
+                    written = os.write(fd, view)
+                    view = view[written:]
+            finally:
+                os.close(fd)
             
             return ToolResult(
                 success=True,
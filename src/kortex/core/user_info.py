@@ -3,13 +3,86 @@ from __future__ import annotations
 
 import logging
 import os
-from pathlib import Path
+from functools import cache, lru_cache
 from typing import Optional
 
 from PySide6.QtCore import QObject, Property, Signal
 
 logger = logging.getLogger(__name__)
 
+#: KDE Plasma face icon names, in priority order
+_FACE_NAMES = (".face", ".face.icon", ".face.png", ".face.jpg", ".face.jpeg")
+
+
+@cache
+def _current_username() -> str:
+    """Get the current Linux username, resolved once per process."""
+    # Try multiple methods to get the username
+    try:
+        # Method 1: Environment variable
+        username = os.environ.get("USER", "")
+        if username:
+            return username
+
+        # Method 2: getlogin
+        import pwd
+        return pwd.getpwuid(os.getuid()).pw_name
+    except Exception as e:
+        logger.warning(f"Failed to get username: {e}")
+        return "User"
+
+
+@lru_cache(maxsize=1)
+def _find_avatar_path(username: str) -> str:
+    """Find the user's avatar image path from various sources."""
+    home = os.path.expanduser("~")
+
+    # One scandir of $HOME replaces an exists()+is_file() stat pair
+    # per candidate name; this runs at QML init, and stats add up on
+    # slow or networked home directories
+    face_names = frozenset(_FACE_NAMES)
+    try:
+        with os.scandir(home) as it:
+            found = {
+                e.name: e.path
+                for e in it
+                if e.name in face_names and e.is_file(follow_symlinks=True)
+            }
+    except OSError as e:
+        logger.debug(f"Failed to scan home directory: {e}")
+        found = {}
+
+    for name in _FACE_NAMES:
+        path = found.get(name)
+        if path:
+            logger.info(f"Found user avatar at: {path}")
+            return path
+
+    # Check AccountsService (works on most modern Linux distros)
+    accounts_service_path = f"/var/lib/AccountsService/icons/{username}"
+    try:
+        os.stat(accounts_service_path)
+        logger.info(f"Found user avatar at AccountsService: {accounts_service_path}")
+        return accounts_service_path
+    except OSError:
+        pass
+
+    # Try to read the AccountsService user file for avatar path;
+    # opening directly subsumes the exists() check
+    try:
+        with open(f"/var/lib/AccountsService/users/{username}") as f:
+            for line in f:
+                if line.startswith("Icon="):
+                    icon_path = line.split("=", 1)[1].strip()
+                    if os.path.exists(icon_path):
+                        logger.info(f"Found user avatar from AccountsService config: {icon_path}")
+                        return icon_path
+    except OSError as e:
+        logger.debug(f"Failed to read AccountsService user file: {e}")
+
+    logger.debug("No user avatar found")
+    return ""
+
 
 class UserInfo(QObject):
     """Provides current Linux user information to QML."""
@@ -19,8 +92,10 @@ class UserInfo(QObject):
     
     def __init__(self, parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
-        self._username = self._get_username()
-        self._avatar_path = self._find_avatar_path()
+        # Cached module helpers: the pwd/NSS fallback and the avatar
+        # scan run at most once even if QML re-instantiates this
+        self._username = _current_username()
+        self._avatar_path = _find_avatar_path(self._username)
     
     @Property(str, notify=usernameChanged)
     def username(self) -> str:
@@ -31,76 +106,3 @@ class UserInfo(QObject):
     def avatarPath(self) -> str:
         """Get the path to the user's avatar image."""
         return self._avatar_path
-    
-    def _get_username(self) -> str:
-        """Get the current Linux username."""
-        # Try multiple methods to get the username
-        try:
-            # Method 1: Environment variable
-            username = os.environ.get("USER", "")
-            if username:
-                return username
-            
-            # Method 2: getlogin
-            import pwd
-            return pwd.getpwuid(os.getuid()).pw_name
-        except Exception as e:
-            logger.warning(f"Failed to get username: {e}")
-            return "User"
-    
-    def _find_avatar_path(self) -> str:
-        """Find the user's avatar image path from various sources."""
-        home = Path.home()
-        
-        # Common avatar locations on Linux/KDE
-        avatar_paths = [
-            # KDE Plasma 5/6 face icon
-            home / ".face",
-            home / ".face.icon",
-            
-            # GNOME/AccountsService avatar
-            Path(f"/var/lib/AccountsService/icons/{self._username}"),
-            
-            # Legacy locations
-            home / ".config" / "kdeglobals",  # May contain face path
-            
-            # Common KDE avatar locations
-            home / ".local" / "share" / "konsole" / "profile.png",
-        ]
-        
-        # Check KDE-specific face icon locations
-        kde_face_paths = [
-            home / ".face",
-            home / ".face.icon", 
-            home / ".face.png",
-            home / ".face.jpg",
-            home / ".face.jpeg",
-        ]
-        
-        for path in kde_face_paths:
-            if path.exists() and path.is_file():
-                logger.info(f"Found user avatar at: {path}")
-                return str(path)
-        
-        # Check AccountsService (works on most modern Linux distros)
-        accounts_service_path = Path(f"/var/lib/AccountsService/icons/{self._username}")
-        if accounts_service_path.exists():
-            logger.info(f"Found user avatar at AccountsService: {accounts_service_path}")
-            return str(accounts_service_path)
-        
-        # Try to read the AccountsService user file for avatar path
-        accounts_user_file = Path(f"/var/lib/AccountsService/users/{self._username}")
-        if accounts_user_file.exists():
-            try:
-                content = accounts_user_file.read_text()
-                for line in content.split("\n"):
-                    if line.startswith("Icon="):
-                        icon_path = line.split("=", 1)[1].strip()
-                        if Path(icon_path).exists():
-                            logger.info(f"Found user avatar from AccountsService config: {icon_path}")
-                            return icon_path
-            except Exception as e:
-                logger.debug(f"Failed to read AccountsService user file: {e}")
-        
-        logger.debug("No user avatar found")
-        return ""
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from PySide6.QtCore import QObject, QUrl, Slot
@@ -40,12 +41,23 @@ class AppController(QObject):
         self._app.quit()
 
 
+@lru_cache(maxsize=1)
 def _find_ui_paths() -> UiPaths:
     # src/kortex/ui/app.py -> src/kortex/ui/qml
     qml_dir = Path(__file__).resolve().parent / "qml"
     return UiPaths(qml_dir=qml_dir)
 
 
+@lru_cache(maxsize=1)
+def _load_tray_icon() -> QIcon:
+    # Theme lookups walk the icon-theme index directories; resolve once
+    # so rebuilding the tray reuses the icon
+    icon = QIcon.fromTheme("assistant")
+    if icon.isNull():
+        icon = QIcon.fromTheme("applications-system")
+    return icon
+
+
 def _create_tray(
     *,
     app: QApplication,
@@ -53,11 +65,7 @@ def _create_tray(
     show_settings: callable,
     quit_app: callable,
 ) -> QSystemTrayIcon:
-    icon = QIcon.fromTheme("assistant")
-    if icon.isNull():
-        icon = QIcon.fromTheme("applications-system")
-
-    tray = QSystemTrayIcon(icon, parent=app)
+    tray = QSystemTrayIcon(_load_tray_icon(), parent=app)
     tray.setToolTip("Kortex")
 
     menu = QMenu()
@@ -104,6 +112,9 @@ def run_ui() -> int:
     # Create and register the chat controller
     chat_controller = ChatController()
     engine.rootContext().setContextProperty("ChatController", chat_controller)
+    # Drain queued database writes on quit so a reply shown moments
+    # before exit is never lost mid-batch
+    app.aboutToQuit.connect(chat_controller.shutdown)
 
     # Create and register user info provider
     user_info = UserInfo()
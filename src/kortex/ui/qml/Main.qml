@@ -123,6 +123,24 @@ ApplicationWindow {
         function onChatsChanged() {
             loadChats()
         }
+
+        function onChatPreviewChanged(chatId, preview, title) {
+            // Update the affected row in place instead of reloading the list
+            for (var i = 0; i < chatsModel.count; i++) {
+                if (chatsModel.get(i).id === chatId) {
+                    chatsModel.setProperty(i, "preview", preview)
+                    if (title) {
+                        chatsModel.setProperty(i, "title", title)
+                    }
+                    // A new message bumps the chat's updated_at, so
+                    // mirror the backend's recency ordering
+                    if (i > 0) {
+                        chatsModel.move(i, 0, 1)
+                    }
+                    break
+                }
+            }
+        }
         
         function onModelsChanged() {
             loadModels()
@@ -244,6 +262,9 @@ ApplicationWindow {
                                 onClicked: {
                                     selectChat(id)
                                 }
+                                onHovered: {
+                                    ChatController.prefetchChat(id)
+                                }
                                 onDeleteClicked: {
                                     deleteChat(id)
                                 }
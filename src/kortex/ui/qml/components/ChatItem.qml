@@ -11,6 +11,7 @@ Item {
 
     signal clicked()
     signal deleteClicked()
+    signal hovered()
 
     implicitHeight: 64
 
@@ -27,6 +28,15 @@ Item {
             anchors.rightMargin: 34  // Leave space for delete button
             hoverEnabled: true
             onClicked: root.clicked()
+            onEntered: hoverTimer.restart()
+            onExited: hoverTimer.stop()
+        }
+
+        // Debounce so quick pointer sweeps don't fire prefetches
+        Timer {
+            id: hoverTimer
+            interval: 100
+            onTriggered: root.hovered()
         }
         
         // Separate hover area for the full item (for showing delete button)
@@ -9,7 +9,10 @@ Item {
 
     property string currentChatId: ""
     property var pendingToolCalls: []
-    
+    // True while an in-progress assistant bubble (fed by response
+    // chunks) is the last row of messagesModel
+    property bool streamingActive: false
+
     signal chatCreated(string chatId)
 
     // Messages model
@@ -24,6 +27,7 @@ Item {
     }
 
     function loadMessages() {
+        streamingActive = false
         messagesModel.clear()
         if (currentChatId) {
             var messages = ChatController.getMessages(currentChatId)
@@ -38,8 +42,28 @@ Item {
         target: ChatController
         
         function onMessagesChanged() {
+            // Reconciles any in-progress bubble with the stored message
             loadMessages()
         }
+
+        function onResponseChunk(chatId, chunk) {
+            if (chatId !== root.currentChatId) return
+            if (!root.streamingActive) {
+                // First token: show an assistant bubble immediately
+                // instead of waiting for the full completion
+                root.streamingActive = true
+                messagesModel.append({
+                    "id": "",
+                    "role": "assistant",
+                    "content": chunk,
+                    "isUser": false
+                })
+            } else {
+                var last = messagesModel.count - 1
+                messagesModel.setProperty(last, "content",
+                    messagesModel.get(last).content + chunk)
+            }
+        }
         
         function onIsLoadingChanged() {
             // Could show loading indicator
@@ -309,7 +333,9 @@ Item {
                 height: 40
                 radius: 20
                 color: "#1b2230"
-                visible: ChatController.isLoading
+                // Once tokens are streaming the bubble itself shows
+                // progress; keep the spinner for the pre-first-token gap
+                visible: ChatController.isLoading && !root.streamingActive
                 
                 Row {
                     id: loadingRow